@@ -9,28 +9,99 @@ Goals:
 - Deterministic load of ./tests/contracts.py (no 'import tests.contracts').
 - Zones extraction:
     1) try tests/contracts.py extractor (if present)
-    2) internal AST extractor on instrument file
-    3) internal fallback (balanced-bracket capture + ast.literal_eval)
+    2) internal AST extractor on instrument file (huge files: simple-literal regex first,
+       PHIO_PROBE_PARSE_MODE=ast|regex|auto)
+    3) internal fallback (simple numeric-literal regex + ast.literal_eval)
+- CLI help: instrument main(["--help"]) called in-process when importable,
+  subprocess otherwise (PHIO_PROBE_HELP=subprocess to force it).
+- --out - writes the baseline to stdout instead of a file; --stable drops the run-specific
+  fields (see strip_volatile) and writes compact key-sorted JSON (byte-comparable across runs).
 - Write forensics into baseline:
     - _probe_forensics
     - zones._forensics
+- File hashes are computed from the content on every run. The internal AST extraction is
+  memoized in-process by (path, mtime_ns, size); PHIO_PROBE_CACHE=1 also keeps it under
+  $XDG_CACHE_HOME/phio_probe (off by default: nothing is written outside the output).
 """
 
 from __future__ import annotations
 
 import argparse
 import ast
+import copy
+import functools
 import hashlib
 import json
+import mmap
 import os
 import platform
 import re
+import stat
 import subprocess
 import sys
+import threading
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:  # optional: faster JSON output, stdlib json stays the reference path
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+__all__ = [
+    "VOLATILE_KEYS",
+    "ZonesExtraction",
+    "ast_extract_zone_thresholds",
+    "axis_cli_level",
+    "axis_zones_level",
+    "cache_dir",
+    "cached_json",
+    "canonicalize_json",
+    "clear_describe_caches",
+    "describe_zones",
+    "describe_zones_in_tree",
+    "ensure_parent_dir",
+    "file_cache_key",
+    "find_zone_marker_line",
+    "global_level",
+    "help_in_process",
+    "in_process_help_enabled",
+    "internal_extract_zones",
+    "json_bytes",
+    "json_sanitize",
+    "load_contracts_module",
+    "load_instrument_module",
+    "main",
+    "normalize_zones_to_json_obj",
+    "parse_help_text",
+    "read_text",
+    "read_text_and_sha256",
+    "regex_extract_zone_thresholds",
+    "regex_first",
+    "run_help",
+    "sha256_bytes",
+    "sha256_file",
+    "stable_json_bytes",
+    "strip_volatile",
+    "try_tests_extractor",
+    "utc_now_iso",
+    "write_json",
+    "write_stdout",
+]
+
+
+# -------------------------
+# Precompiled patterns (the probe runs in CI loops)
+# -------------------------
+
+_LONG_FLAG_RE = re.compile(r"(?<!\w)(--[A-Za-z0-9_\-τ]+)")
+_CMDS_HEADER_RE = re.compile(r"^\s*(Commands|Subcommands)\s*:\s*$")
+_SUBCMD_LINE_RE = re.compile(r"^\s*([a-z][a-z0-9\-]*)\s{2,}.*$")
+_ZONE_ASSIGN_LINE_RE = re.compile(r"^\s*ZONE_THRESHOLDS\s*=")
+_ZONE_ASSIGN_MULTILINE_RE = re.compile(r"^\s*ZONE_THRESHOLDS\s*=", re.MULTILINE)
 
 
 # -------------------------
@@ -43,14 +114,53 @@ def sha256_bytes(b: bytes) -> str:
     return h.hexdigest()
 
 
+_HASH_CHUNK = 64 * 1024  # pre-3.11 fallback: big enough to amortize read() calls, small enough for L2
+_MMAP_MIN_SIZE = 4 * 1024 * 1024  # from here on, hash/decode straight from the page cache
+
+
 def sha256_file(path: Path) -> str:
-    return sha256_bytes(path.read_bytes())
+    """
+    sha256 of the file content, hashed on every call: a forensic digest never comes
+    from a cache keyed on mtime/size (a same-size edit can keep both).
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return sha256_bytes(mm)
+        if sys.version_info >= (3, 11):
+            # hashing loop runs in C (readinto a reusable buffer)
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+        return h.hexdigest()
 
 
 def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="replace")
 
 
+def _decode_source(buf: Any) -> str:
+    # utf-8 with replace + universal newlines, as read_text() does; buf: bytes or mmap
+    text = str(buf, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_text_and_sha256(path: Path) -> Tuple[str, str]:
+    """
+    One read for both: (text as read_text() returns it, sha256 of the raw bytes).
+    Large files are mmapped: no intermediate bytes copy of the whole file.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _decode_source(mm), sha256_bytes(mm)
+        raw = f.read()
+    return _decode_source(raw), sha256_bytes(raw)
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -59,21 +169,171 @@ def ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def json_bytes(obj: Any) -> bytes:
+    """
+    obj as indented UTF-8 JSON (+ trailing newline), via orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=False) + "\n").encode("utf-8")
+
+
+# Run-specific top-level fields, left out by --stable and ignored by test_99
+VOLATILE_KEYS = frozenset({"validation_timestamp", "instrument_path", "instrument_hash", "_probe_forensics"})
+
+
+def strip_volatile(baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    baseline without its run-specific fields: VOLATILE_KEYS, and cli._forensics.cmd
+    (absolute interpreter and instrument paths of the machine that ran the probe).
+    """
+    d = {k: v for k, v in baseline.items() if k not in VOLATILE_KEYS}
+    cli = d.get("cli")
+    fx = cli.get("_forensics") if isinstance(cli, dict) else None
+    if isinstance(fx, dict) and "cmd" in fx:
+        d["cli"] = {**cli, "_forensics": {k: v for k, v in fx.items() if k != "cmd"}}
+    return d
+
+
+def stable_json_bytes(baseline: Dict[str, Any]) -> bytes:
+    """
+    strip_volatile(baseline) as compact, key-sorted UTF-8 JSON (no trailing newline):
+    two runs of an unchanged contract give equal bytes. Always the stdlib encoder:
+    orjson spells some floats differently (1e-05 -> 0.00001, 1e+16 -> 1e16), and these
+    bytes must not depend on which accelerators are installed.
+    """
+    return json.dumps(
+        strip_volatile(baseline), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """
+    Write json_bytes(obj) to path.
+    """
+    path.write_bytes(json_bytes(obj))
+
+
+def write_stdout(data: bytes) -> None:
+    """
+    Write data to stdout as bytes when it has a binary buffer (decoded otherwise).
+    """
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buf.write(data)
+    buf.flush()
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_json_native(obj: Any) -> bool:
+    """
+    True iff json.dumps(obj) would succeed (same isinstance rules as the encoder),
+    without serializing anything.
+    """
+    if type(obj) in _JSON_SCALAR_TYPES:  # exact-type lookup: the common case
+        return True
+    if isinstance(obj, (str, int, float)):
+        return True
+    if isinstance(obj, (list, tuple)):
+        return all(_is_json_native(x) for x in obj)
+    if isinstance(obj, dict):
+        return all(
+            (k is None or isinstance(k, (str, int, float))) and _is_json_native(v)
+            for k, v in obj.items()
+        )
+    return False
+
+
 def json_sanitize(obj: Any) -> Any:
     """
     Ensure obj is JSON-serializable (best-effort) without injecting code.
     """
-    try:
-        json.dumps(obj)
+    if _is_json_native(obj):
         return obj
-    except TypeError:
-        if isinstance(obj, (set, tuple)):
-            return [json_sanitize(x) for x in obj]
-        if isinstance(obj, bytes):
-            return obj.decode("utf-8", errors="replace")
-        if isinstance(obj, Path):
-            return str(obj)
-        return repr(obj)
+    if isinstance(obj, (set, tuple)):
+        return [json_sanitize(x) for x in obj]
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, Path):
+        return str(obj)
+    return repr(obj)
+
+
+def canonicalize_json(obj: Any) -> Any:
+    """
+    Recursively sort dict keys (by str(key)) for deterministic JSON.
+    Lists keep their order (assumed meaningful). Sets/tuples are converted by json_sanitize().
+    """
+    obj = json_sanitize(obj)
+    if isinstance(obj, dict):
+        return {k: canonicalize_json(obj[k]) for k in sorted(obj.keys(), key=lambda x: str(x))}
+    if isinstance(obj, list):
+        return [canonicalize_json(x) for x in obj]
+    return obj
+
+
+# -------------------------
+# Result cache keyed by (path, mtime_ns, size): in-memory L1 + on-disk L2
+# -------------------------
+
+_MEMO: Dict[Tuple[Any, ...], Any] = {}
+
+
+def cache_dir() -> Optional[Path]:
+    """
+    On-disk cache location ($XDG_CACHE_HOME/phio_probe, default ~/.cache/phio_probe),
+    or None unless PHIO_PROBE_CACHE=1 opts in to the on-disk layer.
+    """
+    if os.getenv("PHIO_PROBE_CACHE", "0").strip() != "1":
+        return None
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "phio_probe"
+
+
+def file_cache_key(kind: str, path: Path, *extra: Any) -> Tuple[Any, ...]:
+    """
+    Cache key invalidated by any edit of `path` (mtime_ns or size change).
+    """
+    st = path.stat()
+    return (kind, str(path.resolve()), st.st_mtime_ns, st.st_size, *extra)
+
+
+def cached_json(key: Tuple[Any, ...], compute: Any) -> Any:
+    """
+    Return compute() memoized under key. Values must be JSON-serializable to reach
+    the on-disk layer; otherwise they are only memoized in-process.
+    """
+    if key in _MEMO:
+        return _MEMO[key]
+
+    d = cache_dir()
+    f = d / (hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + ".json") if d is not None else None
+    key_json = json.loads(json.dumps(key))  # tuples -> lists, as read back from disk
+    if f is not None:
+        try:
+            entry = json.loads(f.read_text(encoding="utf-8"))
+            if entry.get("key") == key_json:
+                _MEMO[key] = entry["value"]
+                return entry["value"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    value = compute()
+    _MEMO[key] = value
+    if f is not None:
+        try:
+            f.parent.mkdir(parents=True, exist_ok=True)
+            tmp = f.with_name(f"{f.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"key": key_json, "value": value}), encoding="utf-8")
+            os.replace(tmp, f)
+        except (OSError, TypeError, ValueError):
+            pass
+    return value
 
 
 # -------------------------
@@ -85,8 +345,6 @@ def load_contracts_module(repo_root: Path) -> Tuple[Optional[Any], Dict[str, Any
     Deterministically load ./tests/contracts.py via importlib.
     Returns (module_or_none, forensics_dict).
     """
-    import importlib.util  # stdlib
-
     contracts_path = repo_root / "tests" / "contracts.py"
     fx: Dict[str, Any] = {
         "contracts_path": str(contracts_path),
@@ -105,26 +363,229 @@ def load_contracts_module(repo_root: Path) -> Tuple[Optional[Any], Dict[str, Any
         fx["contracts_load_error"] = f"sha256_failed: {type(e).__name__}: {e}"
         return None, fx
 
+    st = contracts_path.stat()
+    mod, err = _exec_contracts_module(str(contracts_path.resolve()), st.st_mtime_ns, st.st_size)
+    if mod is None:
+        fx["contracts_load_error"] = err
+        return None, fx
+    fx["contracts_loaded"] = True
+    return mod, fx
+
+
+# Names under which the same tests/contracts.py may already be imported in this process
+# (pytest's package import)
+_CONTRACTS_MODULE_NAMES = ("tests.contracts",)
+
+
+def _imported_contracts_module(path_str: str, mtime_ns: int, size: int) -> Optional[Any]:
+    for name in _CONTRACTS_MODULE_NAMES:
+        mod = sys.modules.get(name)
+        origin = getattr(mod, "__file__", None)
+        if (
+            origin
+            and getattr(mod, "_SOURCE_STAT", None) == (mtime_ns, size)
+            and os.path.realpath(origin) == path_str
+        ):
+            return mod
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _exec_contracts_module(path_str: str, mtime_ns: int, size: int) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Execute the contracts file once per (path, mtime_ns, size): repeated probe runs in
+    one process (pytest, watch mode) reuse the module; an edit re-executes it.
+    A copy already imported from the same unchanged file is reused as is, so its
+    caches (parsed AST, zone extraction) are shared rather than rebuilt.
+    Returns (module, None) or (None, error).
+    """
+    import importlib.util  # stdlib
+
+    mod = _imported_contracts_module(path_str, mtime_ns, size)
+    if mod is not None:
+        return mod, None
     try:
-        spec = importlib.util.spec_from_file_location("phio_contracts_local", str(contracts_path))
+        spec = importlib.util.spec_from_file_location("phio_contracts_local", path_str)
         if spec is None or spec.loader is None:
-            fx["contracts_load_error"] = "spec_from_file_location returned None"
-            return None, fx
+            return None, "spec_from_file_location returned None"
         mod = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(mod)  # type: ignore[attr-defined]
-        fx["contracts_loaded"] = True
-        return mod, fx
+        return mod, None
     except Exception as e:
-        fx["contracts_load_error"] = f"{type(e).__name__}: {e}"
-        return None, fx
+        return None, f"{type(e).__name__}: {e}"
 
 
 # -------------------------
-# CLI help probe (subprocess)
+# CLI help probe (in-process when possible, subprocess otherwise)
 # -------------------------
 
+def in_process_help_enabled() -> bool:
+    return os.getenv("PHIO_PROBE_HELP", "").strip().lower() != "subprocess"
+
+
+def load_instrument_module(instrument_path: Path) -> Optional[Any]:
+    """
+    Import the instrument like `python <instrument>` would see it (its directory first
+    on sys.path), without running its __main__ block. Returns the module only if it
+    exposes main(argv); None otherwise (caller falls back to a subprocess).
+    Imported once per (path, mtime_ns, size).
+    """
+    try:
+        st = instrument_path.stat()
+    except OSError:
+        return None
+    return _import_instrument(str(instrument_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _import_instrument(path_str: str, mtime_ns: int, size: int) -> Optional[Any]:
+    import importlib.util  # stdlib
+    import inspect  # stdlib
+
+    parent = str(Path(path_str).parent)
+    inserted = parent not in sys.path
+    if inserted:
+        sys.path.insert(0, parent)
+    try:
+        spec = importlib.util.spec_from_file_location("phio_instrument_probe", path_str)
+        if spec is None or spec.loader is None:
+            return None
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+        main_fn = getattr(mod, "main", None)
+        if not callable(main_fn) or not inspect.signature(main_fn).parameters:
+            return None
+        return mod
+    except (Exception, SystemExit):  # an instrument may sys.exit() at import time
+        return None
+    finally:
+        # only needed while its module-level imports run
+        if inserted:
+            try:
+                sys.path.remove(parent)
+            except ValueError:
+                pass
+
+
+def help_in_process(mod: Any) -> Tuple[int, str, str]:
+    """
+    mod.main(["--help"]) with captured output. COLUMNS is pinned as for a piped
+    subprocess (argparse wraps at 80 columns there), so the text is byte-identical.
+    """
+    import contextlib  # stdlib
+    import io  # stdlib
+
+    out, err = io.StringIO(), io.StringIO()
+    prev_columns = os.environ.get("COLUMNS")
+    os.environ["COLUMNS"] = prev_columns or "80"
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                rc = mod.main(["--help"])
+            except SystemExit as e:
+                rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        if prev_columns is None:
+            os.environ.pop("COLUMNS", None)
+    return (rc or 0), out.getvalue(), err.getvalue()
+
+
+def _fill_cli_from_help(out: Dict[str, Any], returncode: int, stdout: str, stderr: str) -> Dict[str, Any]:
+    txt = (stdout or "") + ("\n" + stderr if stderr else "")
+    out["_forensics"]["returncode"] = returncode
+    out["_forensics"]["stderr_tail"] = (stderr or "")[-400:] if stderr else ""
+    out["help_valid"] = (returncode == 0) and (len((stdout or "").strip()) > 0)
+    out["help_len"] = len(txt)
+
+    flags, subcommands = parse_help_text(txt)
+    out["flags"] = sorted(flags)
+    out["tau_aliases"]["has_tau_ascii"] = "--agg_tau" in flags
+    out["tau_aliases"]["has_tau_unicode"] = "--agg_τ" in flags
+    out["subcommands"] = sorted(subcommands)
+    return out
+
+
+def parse_help_text(txt: str) -> Tuple[Set[str], Set[str]]:
+    """
+    One pass over the help lines -> (long flags, subcommands listed under the first
+    'Commands:'/'Subcommands:' header, up to the next blank line).
+    Flags never span lines, so per-line matching equals a whole-text findall.
+    """
+    flags: Set[str] = set()
+    subcommands: Set[str] = set()
+    state = 0  # 0: before header, 1: inside the commands block, 2: after it
+    for line in txt.splitlines():
+        if "--" in line:
+            flags.update(_LONG_FLAG_RE.findall(line))
+        if state == 0:
+            if _CMDS_HEADER_RE.search(line):
+                state = 1
+        elif state == 1:
+            stripped = line.strip()
+            if not stripped:
+                state = 2
+                continue
+            m = _SUBCMD_LINE_RE.match(stripped)
+            if m:
+                subcommands.add(m.group(1))
+    return flags, subcommands
+
+
+MAX_HELP_BYTES = 128 * 1024  # per stream; far more than any argparse --help
+
+
+def _run_capped(cmd: List[str], timeout_s: float, env: Dict[str, str],
+                max_bytes: int = MAX_HELP_BYTES) -> Tuple[int, str, str, bool]:
+    """
+    subprocess.run(capture_output=True) without the unbounded buffers: each pipe is
+    pumped by a thread that keeps at most max_bytes; the first overflow kills the
+    process. Returns (returncode, stdout, stderr, truncated).
+    Raises subprocess.TimeoutExpired after killing and reaping the process.
+    """
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, env=env)
+    bufs = (bytearray(), bytearray())
+    truncated = threading.Event()
+
+    def pump(stream: Any, buf: bytearray) -> None:
+        while True:
+            chunk = stream.read1(_HASH_CHUNK)
+            if not chunk:
+                return
+            room = max_bytes - len(buf)
+            buf += chunk[:room]
+            if len(chunk) > room:
+                truncated.set()
+                proc.kill()
+                return
+
+    pumps = [threading.Thread(target=pump, args=(stream, buf), daemon=True)
+             for stream, buf in zip((proc.stdout, proc.stderr), bufs)]
+    for t in pumps:
+        t.start()
+    try:
+        rc = proc.wait(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for t in pumps:
+            t.join(timeout=1.0)
+        proc.stdout.close()  # type: ignore[union-attr]
+        proc.stderr.close()  # type: ignore[union-attr]
+    return rc, _decode_source(bufs[0]), _decode_source(bufs[1]), truncated.is_set()
+
+
 def run_help(instrument_path: Path, timeout_s: int = 20) -> Dict[str, Any]:
-    cmd = [sys.executable, str(instrument_path), "--help"]
+    """
+    CLI contract from `<instrument> --help`. The instrument's main(argv) is called
+    in-process (no interpreter startup); a subprocess is used when it cannot be
+    imported, or always with PHIO_PROBE_HELP=subprocess.
+    """
+    # -s: no user site-packages (not -I, which would also drop the instrument's own
+    # directory from sys.path and break sibling imports)
+    cmd = [sys.executable, "-s", str(instrument_path), "--help"]
     out: Dict[str, Any] = {
         "help_valid": False,
         "help_len": 0,
@@ -141,43 +602,25 @@ def run_help(instrument_path: Path, timeout_s: int = 20) -> Dict[str, Any]:
         },
     }
 
+    if in_process_help_enabled():
+        mod = load_instrument_module(instrument_path)
+        if mod is not None:
+            try:
+                rc, stdout, stderr = help_in_process(mod)
+            except Exception:
+                pass  # crashed in-process: let the subprocess run report it
+            else:
+                return _fill_cli_from_help(out, rc, stdout, stderr)
+
     try:
-        cp = subprocess.run(
+        rc, stdout, stderr, truncated = _run_capped(
             cmd,
-            text=True,
-            capture_output=True,
-            timeout=timeout_s,
-            check=False,
+            timeout_s,
+            {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONNOUSERSITE": "1"},
         )
-        txt = (cp.stdout or "") + ("\n" + cp.stderr if cp.stderr else "")
-        out["_forensics"]["returncode"] = cp.returncode
-        out["_forensics"]["stderr_tail"] = (cp.stderr or "")[-400:] if cp.stderr else ""
-        out["help_valid"] = (cp.returncode == 0) and (len((cp.stdout or "").strip()) > 0)
-        out["help_len"] = len(txt)
-
-        flags = set(re.findall(r"(?<!\w)(--[A-Za-z0-9_\-τ]+)", txt))
-        out["flags"] = sorted(flags)
-
-        out["tau_aliases"]["has_tau_ascii"] = "--agg_tau" in flags
-        out["tau_aliases"]["has_tau_unicode"] = "--agg_τ" in flags
-
-        # Subcommands: best-effort extraction
-        subcommands: List[str] = []
-        lines = txt.splitlines()
-        idx_cmd = None
-        for i, line in enumerate(lines):
-            if re.search(r"^\s*(Commands|Subcommands)\s*:\s*$", line):
-                idx_cmd = i
-                break
-        if idx_cmd is not None:
-            for j in range(idx_cmd + 1, len(lines)):
-                if lines[j].strip() == "":
-                    break
-                m = re.match(r"^\s*([a-z][a-z0-9\-]*)\s{2,}.*$", lines[j].strip())
-                if m:
-                    subcommands.append(m.group(1))
-        out["subcommands"] = sorted(set(subcommands))
-        return out
+        if truncated:
+            out["_forensics"]["help_truncated"] = True  # key only present when the cap was hit
+        return _fill_cli_from_help(out, rc, stdout, stderr)
 
     except subprocess.TimeoutExpired:
         out["_forensics"]["returncode"] = "timeout"
@@ -206,105 +649,168 @@ class ZonesExtraction:
     forensics: Dict[str, Any]
 
 
-def find_zone_marker_line(text: str) -> Optional[int]:
-    # Prefer an assignment-like marker
-    for i, line in enumerate(text.splitlines(), start=1):
-        if re.match(r"^\s*ZONE_THRESHOLDS\s*=", line):
-            return i
-    # Fallback: any occurrence
-    for i, line in enumerate(text.splitlines(), start=1):
-        if "ZONE_THRESHOLDS" in line:
+def find_zone_marker_line(lines: List[str]) -> Optional[int]:
+    """
+    1-based line of the ZONE_THRESHOLDS marker in pre-split source lines.
+    Prefers an assignment-like line; falls back to the first occurrence. Single pass.
+    """
+    first_any: Optional[int] = None
+    for i, line in enumerate(lines, start=1):
+        if "ZONE_THRESHOLDS" not in line:
+            continue
+        if _ZONE_ASSIGN_LINE_RE.match(line):
             return i
-    return None
+        if first_any is None:
+            first_any = i
+    return first_any
 
 
-def ast_extract_zone_thresholds(text: str) -> Tuple[Optional[Any], Optional[str]]:
+def ast_extract_zone_thresholds(text: str, has_marker: Optional[bool] = None) -> Tuple[Optional[Any], Optional[str]]:
     """
     Parse python source and extract the literal value assigned to ZONE_THRESHOLDS if possible.
     Returns (value_or_none, error_or_none).
+    has_marker: precomputed `"ZONE_THRESHOLDS" in text` (computed if None); when False the
+    parse is skipped and the result is the same as a parsed file without the assignment.
     """
+    if has_marker is None:
+        has_marker = "ZONE_THRESHOLDS" in text
+    if not has_marker:
+        return None, "not_found_in_ast"
+
     try:
-        tree = ast.parse(text)
+        tree = _parse_module(text)
+    except SyntaxError as e:
+        # Broken trailer (e.g. a truncated or half-edited file): the statements before the
+        # error line may still parse on their own. Values still come from a real AST.
+        tree = _parse_prefix(text, e.lineno)
+        if tree is None:
+            return None, f"ast_parse_failed: {type(e).__name__}: {e}"
     except Exception as e:
         return None, f"ast_parse_failed: {type(e).__name__}: {e}"
 
-    for node in ast.walk(tree):
-        # Handle Assign and AnnAssign
+    # ZONE_THRESHOLDS is a module-level constant: top-level statements first; the nested
+    # statements are only walked when they miss (same first match as ast.walk)
+    node = _find_zone_assign(tree.body)
+    if node is None:
+        node = _find_zone_assign(_walk_statements(tree))
+    if node is None:
+        return None, "not_found_in_ast"
+    val = _eval_num_seq(node.value)
+    if val is not None:
+        return val, None
+    try:
+        return ast.literal_eval(node.value), None  # mappings and other literal shapes
+    except Exception as e:
+        return None, f"literal_eval_failed: {type(e).__name__}: {e}"
+
+
+def _parse_module(text: str) -> ast.Module:
+    # ast.parse without its Python-level wrapper: same tree, same "<unknown>" filename in
+    # SyntaxError messages; dont_inherit keeps this file's __future__ flags out of it
+    return compile(text, "<unknown>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _eval_num_seq(node: Any) -> Optional[Any]:
+    """
+    Fast path for the usual shape, a list/tuple of (signed) int/float constants.
+    Same result as ast.literal_eval (container and element types kept); None for any
+    other shape, which then goes through literal_eval.
+    """
+    if not isinstance(node, (ast.List, ast.Tuple)):
+        return None
+    out: List[Any] = []
+    for elt in node.elts:
+        sign = 1
+        if isinstance(elt, ast.UnaryOp) and isinstance(elt.op, (ast.USub, ast.UAdd)):
+            sign = -1 if isinstance(elt.op, ast.USub) else 1
+            elt = elt.operand
+        if not isinstance(elt, ast.Constant):
+            return None
+        v = elt.value
+        if type(v) not in (int, float):  # excludes bool, complex, str
+            return None
+        out.append(-v if sign < 0 else v)
+    return out if isinstance(node, ast.List) else tuple(out)
+
+
+# Fields holding statement lists (or except handlers / match cases holding them), in the
+# order ast.iter_child_nodes yields them for every node type that has them.
+_STMT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def _walk_statements(tree: ast.Module) -> Iterator[Any]:
+    """
+    ast.walk restricted to statements: same breadth-first order, but expressions (the
+    bulk of the nodes) are never visited, since an Assign can only sit in a statement
+    list. Yields statements plus the ExceptHandler/match_case nodes between them.
+    """
+    todo = deque(tree.body)
+    while todo:
+        node = todo.popleft()
+        yield node
+        for field in _STMT_FIELDS:
+            sub = getattr(node, field, None)
+            if sub:
+                todo.extend(sub)
+
+
+def _find_zone_assign(nodes: Any) -> Optional[Any]:
+    for node in nodes:
         if isinstance(node, ast.Assign):
             for tgt in node.targets:
                 if isinstance(tgt, ast.Name) and tgt.id == "ZONE_THRESHOLDS":
-                    try:
-                        return ast.literal_eval(node.value), None
-                    except Exception as e:
-                        return None, f"literal_eval_failed: {type(e).__name__}: {e}"
-        if isinstance(node, ast.AnnAssign):
+                    return node
+        elif isinstance(node, ast.AnnAssign):
             tgt = node.target
             if isinstance(tgt, ast.Name) and tgt.id == "ZONE_THRESHOLDS" and node.value is not None:
-                try:
-                    return ast.literal_eval(node.value), None
-                except Exception as e:
-                    return None, f"literal_eval_failed: {type(e).__name__}: {e}"
-
-    return None, "not_found_in_ast"
-
-
-def balanced_capture_after_equals(text: str, name: str = "ZONE_THRESHOLDS") -> Tuple[Optional[str], Optional[str]]:
-    """
-    Fallback extractor: locate 'NAME =' then capture a balanced bracket expression starting at first
-    '[', '{', '(' until matching closing bracket.
-    """
-    m = re.search(rf"^\s*{re.escape(name)}\s*=\s*", text, flags=re.MULTILINE)
-    if not m:
-        return None, "assign_marker_not_found"
-
-    start = m.end()
-    n = len(text)
-    i = start
-    while i < n and text[i].isspace():
-        i += 1
-    if i >= n:
-        return None, "unexpected_eof_after_equals"
-
-    opener = text[i]
-    pairs = {"[": "]", "{": "}", "(": ")"}
-    if opener not in pairs:
-        return None, f"unexpected_opener:{repr(opener)}"
-
-    stack = [opener]
-    j = i + 1
-    in_str: Optional[str] = None
-    escape = False
-
-    while j < n:
-        ch = text[j]
-        if in_str:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == in_str:
-                in_str = None
-            j += 1
-            continue
+                return node
+    return None
 
-        if ch in ("'", '"'):
-            in_str = ch
-            j += 1
-            continue
 
-        if ch in pairs:
-            stack.append(ch)
-        elif ch in ("]", "}", ")"):
-            if not stack:
-                return None, "unbalanced_closing"
-            top = stack.pop()
-            if pairs[top] != ch:
-                return None, "mismatched_brackets"
-            if not stack:
-                return text[i : j + 1], None
-        j += 1
+def _parse_prefix(text: str, error_lineno: Optional[int]) -> Optional[ast.Module]:
+    if not error_lineno or error_lineno <= 1:
+        return None
+    prefix = "\n".join(text.splitlines()[: error_lineno - 1])
+    try:
+        return _parse_module(prefix)
+    except Exception:
+        return None
+
 
-    return None, "unterminated_brackets"
+# Large-file shortcut: a top-level `ZONE_THRESHOLDS = [numbers]` (or tuple) is read
+# without building the whole AST. PHIO_PROBE_PARSE_MODE=ast|regex|auto overrides.
+REGEX_FIRST_MIN_CHARS = 200_000
+_ZT_SIMPLE_LITERAL_RE = re.compile(
+    r"^ZONE_THRESHOLDS[ \t]*(?::[^=\n]*)?=[ \t]*(\[[-+0-9.eE_,\s]*\]|\([-+0-9.eE_,\s]*\))",
+    re.MULTILINE,
+)
+
+
+def regex_first(text: str) -> bool:
+    mode = os.getenv("PHIO_PROBE_PARSE_MODE", "auto").strip().lower()
+    if mode == "ast":
+        return False
+    if mode == "regex":
+        return True
+    return len(text) > REGEX_FIRST_MIN_CHARS
+
+
+def regex_extract_zone_thresholds(text: str) -> Optional[Any]:
+    """
+    Value of a simple numeric-literal ZONE_THRESHOLDS assignment, else None (caller goes to AST).
+    """
+    m = _ZT_SIMPLE_LITERAL_RE.search(text)
+    if m is None:
+        return None
+    try:
+        val = ast.literal_eval(m.group(1))
+    except Exception:
+        return None
+    if not isinstance(val, (list, tuple)):  # "(1)" is an int, not a tuple
+        return None
+    if not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in val):
+        return None
+    return val
 
 
 def normalize_zones_to_json_obj(z: Any) -> Tuple[Dict[str, Any], int]:
@@ -323,41 +829,255 @@ def normalize_zones_to_json_obj(z: Any) -> Tuple[Dict[str, Any], int]:
     return {"_value": json_sanitize(z)}, 0
 
 
-def internal_extract_zones(instrument_path: Path) -> ZonesExtraction:
-    text = read_text(instrument_path)
-    marker_line = find_zone_marker_line(text)
+def internal_extract_zones(
+    instrument_path: Path, instrument_sha256: Optional[str] = None, text: Optional[str] = None
+) -> ZonesExtraction:
+    """
+    instrument_sha256 / text: already read by the caller (see read_text_and_sha256);
+    read and hashed here in one pass if missing.
+    """
+    if text is None or instrument_sha256 is None:
+        text, instrument_sha256 = read_text_and_sha256(instrument_path)
+    # splitlines() only when the marker can be there at all
+    marker_line = find_zone_marker_line(text.splitlines()) if "ZONE_THRESHOLDS" in text else None
     has_marker = marker_line is not None
 
     fx: Dict[str, Any] = {
         "instrument_has_ZONE_THRESHOLDS": bool(has_marker),
         "instrument_zone_line": marker_line,
-        "instrument_sha256": sha256_file(instrument_path) if instrument_path.exists() else None,
+        "instrument_sha256": instrument_sha256,
         "instrument_head_sha256": sha256_bytes(text[:2048].encode("utf-8", errors="replace")),
         "internal_ast_error": None,
         "internal_fallback_error": None,
+        # no longer filled since the balanced-bracket fallback is gone; kept for baseline shape
         "internal_fallback_literal_eval_error": None,
         "captured_literal_len": None,
     }
 
-    # AST path
-    val, err = ast_extract_zone_thresholds(text)
+    # Huge instruments: cheap regex read of the common literal form before any parse
+    regex_tried = has_marker and regex_first(text)
+    if regex_tried:
+        val = regex_extract_zone_thresholds(text)
+        if val is not None:
+            return ZonesExtraction(ok=True, method="internal_regex_literal", value=val, error=None, forensics=fx)
+
+    # AST path (cached per instrument state; the probe's own state is part of the key
+    # so that an extractor change invalidates previous results)
+    probe_path = Path(__file__).resolve()
+    if has_marker:
+        val, err = cached_json(
+            file_cache_key("zones_ast", instrument_path, file_cache_key("probe", probe_path)),
+            lambda: list(ast_extract_zone_thresholds(text, has_marker=True)),
+        )
+    else:
+        val, err = None, "not_found_in_ast"
     if val is not None:
         return ZonesExtraction(ok=True, method="internal_ast_assign", value=val, error=None, forensics=fx)
     fx["internal_ast_error"] = err
 
-    # Balanced capture + literal_eval
-    lit, err2 = balanced_capture_after_equals(text, "ZONE_THRESHOLDS")
-    if lit is None:
-        fx["internal_fallback_error"] = err2
-        return ZonesExtraction(ok=False, method="internal_failed", value=None, error=err2, forensics=fx)
+    # Last resort when the AST path failed: the simple numeric-literal form
+    if has_marker and not regex_tried:
+        val = regex_extract_zone_thresholds(text)
+        if val is not None:
+            return ZonesExtraction(ok=True, method="internal_regex_literal", value=val, error=None, forensics=fx)
+    has_assign = has_marker and _ZONE_ASSIGN_MULTILINE_RE.search(text) is not None
+    err2 = "regex_no_simple_literal" if has_assign else "assign_marker_not_found"
+    fx["internal_fallback_error"] = err2
+    return ZonesExtraction(ok=False, method="internal_failed", value=None, error=err2, forensics=fx)
+
 
-    fx["captured_literal_len"] = len(lit)
+# -------------------------
+# Descriptive zone extraction (re-exported by docs/tests/contracts.py)
+# -------------------------
+# Broader than internal_extract_zones: besides ZONE_THRESHOLDS it recognizes other
+# candidate names, the largest "interesting" module-level dict and a
+# `if T < x: zone = "..."` chain. Shape only, never meaning.
+
+_DESCRIBE_CANDIDATE_NAMES = frozenset(
+    ("ZONE_THRESHOLDS", "ZONES", "ZONE_BOUNDS", "ZONE_LIMITS", "ZONE_CUTS", "THRESHOLDS")
+)
+# "THRESHOLD"/"MAPPING" are already covered by "THRESH"/"MAP"
+_DESCRIBE_KEYWORDS = ("ZONE", "ZONING", "THRESH", "MAP")
+# only these nodes literal_eval to a list/tuple/dict
+_CONTAINER_NODES = (ast.List, ast.Tuple, ast.Dict)
+_CHAIN_VAR_NAMES = frozenset(("T", "t"))
+_CHAIN_ZONE_NAMES = frozenset(("zone", "Z", "label"))
+_ZT_LIST_RE = re.compile(r"ZONE_THRESHOLDS\s*=\s*\[([^\]]+)\]")
+_ZT_TUPLE_RE = re.compile(r"ZONE_THRESHOLDS\s*=\s*\(([^\)]+)\)")
+_NUM_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def _literal_or_none(node: ast.AST) -> Any:
     try:
-        v2 = ast.literal_eval(lit)
-        return ZonesExtraction(ok=True, method="internal_regex_balanced_literal_eval", value=v2, error=None, forensics=fx)
-    except Exception as e:
-        fx["internal_fallback_literal_eval_error"] = f"{type(e).__name__}: {e}"
-        return ZonesExtraction(ok=False, method="internal_failed", value=None, error=fx["internal_fallback_literal_eval_error"], forensics=fx)
+        return ast.literal_eval(node)
+    except Exception:
+        return None
+
+
+def _is_number(x: Any) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _is_interesting_name(name: str) -> bool:
+    u = name.upper()
+    return any(k in u for k in _DESCRIBE_KEYWORDS)
+
+
+def _candidate_value(name: str, value_node: ast.AST) -> Optional[Dict[str, Any]]:
+    val = _eval_num_seq(value_node)
+    if val is None:
+        val = _literal_or_none(value_node)
+    if isinstance(val, (list, tuple)) and len(val) > 0 and all(_is_number(x) for x in val):
+        return {"thresholds": [float(x) for x in val], "pattern": "assign", "name": name}
+    if isinstance(val, dict) and len(val) > 0:
+        return {"mapping": val, "pattern": "assign", "name": name}
+    return None
+
+
+def _interesting_dict(value_node: ast.AST) -> Optional[Tuple[str, Dict[Any, Any]]]:
+    lit = _literal_or_none(value_node)
+    if isinstance(lit, dict) and lit:
+        key = "thresholds" if any(isinstance(v, (int, float)) for v in lit.values()) else "mapping"
+        return key, lit
+    return None
+
+
+def _dict_size(c: Dict[str, Any]) -> int:
+    d = c.get("thresholds") or c.get("mapping") or {}
+    return len(d) if isinstance(d, dict) else 0
+
+
+def _chain_threshold(test: ast.AST) -> Optional[float]:
+    if not isinstance(test, ast.Compare) or len(test.ops) != 1 or len(test.comparators) != 1:
+        return None
+    if not isinstance(test.left, ast.Name) or test.left.id not in _CHAIN_VAR_NAMES:
+        return None
+    val = _literal_or_none(test.comparators[0])
+    return float(val) if _is_number(val) else None
+
+
+def _chain_zone(body: List[ast.stmt]) -> Optional[str]:
+    for st in body:
+        if isinstance(st, ast.Assign) and len(st.targets) == 1 and isinstance(st.targets[0], ast.Name):
+            if st.targets[0].id in _CHAIN_ZONE_NAMES:
+                val = _literal_or_none(st.value)
+                if isinstance(val, str) and val:
+                    return val
+    return None
+
+
+def _if_chain(node: ast.If) -> Optional[Dict[str, Any]]:
+    """`if T < x: zone = "..."` / elif ... read link by link; None at the first invalid link."""
+    thresholds: List[float] = []
+    zones: List[str] = []
+    cur = node
+    while True:
+        th = _chain_threshold(cur.test)
+        z = _chain_zone(cur.body) if th is not None else None
+        if z is None:
+            return None
+        thresholds.append(th)  # type: ignore[arg-type]
+        zones.append(z)
+        if len(cur.orelse) != 1 or not isinstance(cur.orelse[0], ast.If):
+            break
+        cur = cur.orelse[0]
+    return {"thresholds": thresholds, "zones": zones, "pattern": "if_chain"}
+
+
+def _regex_zone_numbers(text: str) -> Optional[Dict[str, Any]]:
+    # no eval at all: only the numbers inside `ZONE_THRESHOLDS = [...]` or `(...)`
+    m = _ZT_LIST_RE.search(text) or _ZT_TUPLE_RE.search(text)
+    if m is None:
+        return None
+    nums = [float(x.group(0)) for x in _NUM_RE.finditer(m.group(1))]
+    if not nums:
+        return None
+    return {"thresholds": nums, "pattern": "fallback_regex", "name": "ZONE_THRESHOLDS"}
+
+
+def describe_zones_in_tree(tree: ast.Module) -> Optional[Dict[str, Any]]:
+    """
+    Zone structure of an already parsed module, first match wins:
+      1) module-level assign/annassign of a candidate name (ZONE_THRESHOLDS, ZONES, ...):
+         list of numbers -> thresholds, dict -> mapping
+      2) the largest module-level dict under an "interesting" name (ZONE/THRESH/MAP...)
+      3) an if/elif chain on T, module level first, then nested (typically in a function)
+    """
+    dicts: List[Dict[str, Any]] = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names = [node.target.id]
+        else:
+            continue
+        if not isinstance(node.value, _CONTAINER_NODES):
+            continue
+        for name in names:
+            if name in _DESCRIBE_CANDIDATE_NAMES:
+                out = _candidate_value(name, node.value)
+                if out:
+                    return out
+        interesting = [n for n in names if _is_interesting_name(n)]
+        found = _interesting_dict(node.value) if interesting and isinstance(node.value, ast.Dict) else None
+        if found is not None:
+            kind = "assign" if isinstance(node, ast.Assign) else "annassign"
+            dicts.extend({"pattern": f"{kind}:{n}", found[0]: found[1]} for n in interesting)
+
+    if dicts:
+        dicts.sort(key=_dict_size, reverse=True)
+        return dicts[0]
+    for node in _walk_statements(tree):  # module level first: breadth-first
+        if isinstance(node, ast.If):
+            out = _if_chain(node)
+            if out is not None:
+                return out
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _describe_zones_cached(path_str: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    try:
+        raw = Path(path_str).read_bytes()
+    except OSError:
+        return None
+    text: Optional[str] = None
+    try:
+        # bytes: the encoding cookie / BOM is honoured as the interpreter would
+        tree: Optional[ast.Module] = compile(raw, path_str, "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+    except (SyntaxError, ValueError):
+        # not strict utf-8 (or broken): one more try on a tolerant decode
+        text = raw.decode("utf-8", "ignore")
+        try:
+            tree = _parse_module(text)
+        except (SyntaxError, ValueError):
+            tree = None
+    if tree is not None:
+        out = describe_zones_in_tree(tree)
+        if out is not None:
+            return out
+    return _regex_zone_numbers(text if text is not None else raw.decode("utf-8", "ignore"))
+
+
+def describe_zones(instrument_path: Any) -> Optional[Dict[str, Any]]:
+    """
+    Best-effort zone thresholds/mapping of a python script (see describe_zones_in_tree),
+    then a regex over `ZONE_THRESHOLDS = [...]` when the AST yields nothing.
+    Memoized per (path, mtime_ns, size); the caller gets its own copy.
+    """
+    path = os.path.abspath(os.fspath(instrument_path))
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return copy.deepcopy(_describe_zones_cached(path, st.st_mtime_ns, st.st_size))
+
+
+def clear_describe_caches() -> None:
+    """Forget memoized describe_zones() results (a rewrite can keep mtime and size)."""
+    _describe_zones_cached.cache_clear()
 
 
 # -------------------------
@@ -434,15 +1154,28 @@ def global_level(axes: Dict[str, str]) -> str:
 # Main
 # -------------------------
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None, repo_root: Optional[Path] = None, canonical: bool = False) -> int:
+    """
+    repo_root: directory holding tests/contracts.py and anchoring relative paths
+    (default: this file's directory). canonical: write keys sorted recursively.
+    """
     ap = argparse.ArgumentParser()
     ap.add_argument("--instrument", required=True, help="Path to instrument python file")
-    ap.add_argument("--out", required=True, help="Output baseline JSON path")
-    args = ap.parse_args()
+    ap.add_argument("--out", required=True, help="Output baseline JSON path ('-' for stdout)")
+    ap.add_argument(
+        "--stable", action="store_true",
+        help="Omit run-specific fields (timestamp, paths, forensics); compact key-sorted JSON",
+    )
+    args = ap.parse_args(argv)
 
-    repo_root = Path(__file__).resolve().parent
+    # single clock read for the whole run: every timestamp in the baseline refers to it
+    validation_timestamp = utc_now_iso()
+
+    repo_root = Path(repo_root).resolve() if repo_root is not None else Path(__file__).resolve().parent
     instrument_path = (repo_root / args.instrument).resolve() if not Path(args.instrument).is_absolute() else Path(args.instrument).resolve()
-    out_path = (repo_root / args.out).resolve() if not Path(args.out).is_absolute() else Path(args.out).resolve()
+    out_path: Optional[Path] = None  # None: stdout
+    if args.out != "-":
+        out_path = (repo_root / args.out).resolve() if not Path(args.out).is_absolute() else Path(args.out).resolve()
 
     probe_path = Path(__file__).resolve()
 
@@ -467,34 +1200,60 @@ def main() -> int:
     contracts_mod, contracts_fx = load_contracts_module(repo_root)
     probe_fx.update({"contracts": contracts_fx})
 
+    instrument_exists = instrument_path.exists()
+    help_inline = instrument_exists and in_process_help_enabled() and load_instrument_module(instrument_path) is not None
+
+    # A subprocess --help only waits on its pipes: overlap it with hashing and zone
+    # extraction on one worker thread. The in-process variant swaps sys.stdout/stderr,
+    # so it stays on this thread (and no pool is needed at all).
+    pool = None
+    cli_future = None
+    cli = run_help(instrument_path) if help_inline else None
+    if instrument_exists and not help_inline:
+        import concurrent.futures  # lazy: pulls in logging, only this path needs it
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        cli_future = pool.submit(run_help, instrument_path)
+    try:
+        # instrument read once: its bytes feed instrument_hash and the zones extraction
+        instrument_text, instrument_sha256 = (
+            read_text_and_sha256(instrument_path) if instrument_exists else (None, None)
+        )
+
+        zones_attempted = True
+        tests_val, tests_fx = try_tests_extractor(contracts_mod, instrument_path)
+        internal = internal_extract_zones(instrument_path, instrument_sha256, instrument_text) if instrument_exists else ZonesExtraction(
+            ok=False, method="internal_failed", value=None, error="instrument_missing",
+            forensics={"instrument_has_ZONE_THRESHOLDS": False, "instrument_zone_line": None}
+        )
+
+        if cli_future is not None:
+            cli = cli_future.result()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    if cli is None:
+        cli = {
+            "help_valid": False, "help_len": 0, "subcommands": [], "flags": [],
+            "required_subcommands": ["new-template", "score"], "required_flags": ["--input", "--outdir"],
+            "tau_aliases": {"has_tau_ascii": False, "has_tau_unicode": False},
+            "_forensics": {"cmd": None, "returncode": None, "timeout_s": None, "stderr_tail": "instrument_missing"},
+        }
+
     baseline: Dict[str, Any] = {
         "contract_version": "1.5",
         "instrument_path": str(instrument_path),
-        "instrument_hash": sha256_file(instrument_path) if instrument_path.exists() else None,
-        "validation_timestamp": utc_now_iso(),
+        "instrument_hash": instrument_sha256,
+        "validation_timestamp": validation_timestamp,
         "_probe_forensics": probe_fx,
         "compliance": {},
         "summary": {},
-        "cli": {},
+        "cli": json_sanitize(cli),
         "zones": {},
         "formula": {"golden_attempted": False, "golden_pass": False},
     }
 
-    cli = run_help(instrument_path) if instrument_path.exists() else {
-        "help_valid": False, "help_len": 0, "subcommands": [], "flags": [],
-        "required_subcommands": ["new-template", "score"], "required_flags": ["--input", "--outdir"],
-        "tau_aliases": {"has_tau_ascii": False, "has_tau_unicode": False},
-        "_forensics": {"cmd": None, "returncode": None, "timeout_s": None, "stderr_tail": "instrument_missing"},
-    }
-    baseline["cli"] = json_sanitize(cli)
-
-    zones_attempted = True
-    tests_val, tests_fx = try_tests_extractor(contracts_mod, instrument_path)
-    internal = internal_extract_zones(instrument_path) if instrument_path.exists() else ZonesExtraction(
-        ok=False, method="internal_failed", value=None, error="instrument_missing",
-        forensics={"instrument_has_ZONE_THRESHOLDS": False, "instrument_zone_line": None}
-    )
-
     zones_method: str
     zones_error: Optional[str]
     zones_value: Any
@@ -546,10 +1305,17 @@ def main() -> int:
         "summary": f"CLI:{axes['cli']}/ZONES:{axes['zones']}/FORMULA:{axes['formula']}",
     }
 
+    if args.stable:
+        data = stable_json_bytes(baseline)
+    else:
+        data = json_bytes(canonicalize_json(baseline) if canonical else baseline)
+
+    if out_path is None:
+        write_stdout(data)
+        return 0
+
     ensure_parent_dir(out_path)
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=False)
-        f.write("\n")
+    out_path.write_bytes(data)
 
     return 0
 
@@ -5,12 +5,28 @@ Sorties:
 - diagnostic_report.json (par défaut)
 """
 
-import argparse, json, re, subprocess, tempfile, sys
+import argparse, contextlib, io, json, re, subprocess, tempfile, sys
 from pathlib import Path
 
+# même import in-process que le probe (dossier de l'instrument sur sys.path le temps de l'import)
+from contract_probe import load_instrument_module
+
 def run(cmd):
     return subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8")
 
+def run_in_process(mod, cmd):
+    """mod.main(argv) avec stdout/stderr capturés, résultat au format CompletedProcess."""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = mod.main(list(cmd[2:]))
+        except SystemExit as e:
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            err.write(f"{type(e).__name__}: {e}\n")
+            rc = 1
+    return subprocess.CompletedProcess(cmd, rc or 0, out.getvalue(), err.getvalue())
+
 def read_source(path: Path):
     return path.read_text(encoding="utf-8")
 
@@ -18,6 +34,8 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--instrument", default="phi_otimes_o_instrument_v0_1.py")
     ap.add_argument("--out", default="diagnostic_report.json")
+    ap.add_argument("--fast", action="store_true",
+                    help="appeler main(argv) in-process au lieu d'un process par commande (repli subprocess si import impossible)")
     args = ap.parse_args()
 
     inst = Path(args.instrument).resolve()
@@ -25,19 +43,22 @@ def main():
         print(f"Instrument introuvable: {inst}", file=sys.stderr)
         return 1
 
-    report = {"instrument": str(inst), "conventions": {}, "cli": {}}
+    mod = load_instrument_module(inst) if args.fast else None
+    call = (lambda cmd: run_in_process(mod, cmd)) if mod is not None else run
+
+    report = {"instrument": str(inst), "conventions": {}, "cli": {"mode": "in_process" if mod is not None else "subprocess"}}
 
     # static hints
     code = read_source(inst)
     report["conventions"]["bottleneck_mentioned"] = "bottleneck" in code.lower()
 
     # help
-    h = run(["python3", str(inst), "--help"])
+    h = call(["python3", str(inst), "--help"])
     report["cli"]["help"] = {"returncode": h.returncode, "stdout": h.stdout, "stderr": h.stderr}
 
     # new-template
     tpl_path = Path("template_diagnostic.json").resolve()
-    nt = run(["python3", str(inst), "new-template", "--name", "Diagnostic", "--out", str(tpl_path)])
+    nt = call(["python3", str(inst), "new-template", "--name", "Diagnostic", "--out", str(tpl_path)])
     report["cli"]["new_template"] = {"returncode": nt.returncode, "stdout": nt.stdout, "stderr": nt.stderr, "path": str(tpl_path)}
     template = None
     if nt.returncode == 0 and tpl_path.exists():
@@ -49,7 +70,7 @@ def main():
     # score baseline
     if template is not None:
         outdir = Path("output_diagnostic").resolve()
-        sc = run(["python3", str(inst), "score", "--input", str(tpl_path), "--outdir", str(outdir)])
+        sc = call(["python3", str(inst), "score", "--input", str(tpl_path), "--outdir", str(outdir)])
         report["cli"]["score_valid"] = {"returncode": sc.returncode, "stdout": sc.stdout, "stderr": sc.stderr}
         res_path = outdir / "results.json"
         if sc.returncode == 0 and res_path.exists():
@@ -58,7 +79,9 @@ def main():
             report["conventions"]["sample_T"] = results.get("T")
             report["conventions"]["sample_K_eff"] = results.get("K_eff")
 
-    Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    # indent => pure-Python encoder either way: stream chunks instead of building the full string
+    with Path(args.out).open("w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
     print(args.out)
     return 0
 
@@ -8,6 +8,7 @@ from typing import Iterator, Optional
 import pytest
 
 from .config import INSTRUMENT_PATH
+from .contracts import run_help
 
 
 def _run(cmd, cwd=None) -> subprocess.CompletedProcess:
@@ -49,6 +50,12 @@ def instrument_path():
     return str(INSTRUMENT_PATH)
 
 
+@pytest.fixture(scope="session")
+def help_text(instrument_path):
+    """Sortie de `<instrument> --help`, calculée une seule fois par session (un seul process)."""
+    return run_help(instrument_path)
+
+
 @pytest.fixture
 def run_cli(tmp_path, instrument_path):
     """Exécute le CLI comme une boîte noire.
@@ -4,12 +4,9 @@ import os
 import warnings
 import tempfile
 
-from .config import INSTRUMENT_PATH
-from .contracts import run_help, parse_help_flags, detect_tau_agg_flag
+from .contracts import parse_help_flags, detect_tau_agg_flag
 
-def test_cli_help_has_core_contract():
-    assert INSTRUMENT_PATH.exists(), f"Instrument introuvable: {INSTRUMENT_PATH}"
-    help_text = run_help(str(INSTRUMENT_PATH))
+def test_cli_help_has_core_contract(help_text):
     flags = parse_help_flags(help_text)
 
     # Contrat minimal CLI
@@ -18,8 +15,7 @@ def test_cli_help_has_core_contract():
     assert flags["mentions_input"], "CLI: option --input non visible dans --help"
     assert flags["mentions_outdir"], "CLI: option --outdir non visible dans --help"
 
-def test_cli_tau_flag_contract_is_non_ambiguous():
-    help_text = run_help(str(INSTRUMENT_PATH))
+def test_cli_tau_flag_contract_is_non_ambiguous(help_text):
     tau_flag = detect_tau_agg_flag(help_text)
 
     # Contrat : si le CLI expose des options d'agrégation, il doit préciser la forme tau
@@ -30,8 +26,7 @@ def test_cli_tau_flag_contract_is_non_ambiguous():
         "CLI: ni --agg_τ ni --agg_tau n'apparaît dans --help alors que des options d'agrégation existent"
     )
 
-def test_cli_bottleneck_documented_if_supported():
-    help_text = run_help(str(INSTRUMENT_PATH))
+def test_cli_bottleneck_documented_if_supported(help_text):
     flags = parse_help_flags(help_text)
     if flags["mentions_bottleneck"]:
         # ok: documented
@@ -8,7 +8,7 @@ The reference implementation lives in scripts/phi_otimes_o_instrument_v0_1.py.
 
 from __future__ import annotations
 
-from scripts.phi_otimes_o_instrument_v0_1 import main as _main  # noqa: F401
+from scripts.phi_otimes_o_instrument_v0_1 import main  # noqa: F401  (re-exported for in-process callers)
 
 if __name__ == "__main__":
-    raise SystemExit(_main())
+    raise SystemExit(main())
@@ -4,11 +4,23 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
 import json
 import os
 from pathlib import Path
 from statistics import median
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # optional: faster JSON parsing, stdlib json stays the reference path
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # optional: typed decode + validation of score inputs in one C pass
+    import msgspec
+except ImportError:  # pragma: no cover - depends on environment
+    msgspec = None
 
 __instrument_id__ = "phi_otimes_o"
 __version__ = "0.1"
@@ -21,6 +33,29 @@ ZONE_LABELS = ["Z0", "Z1", "Z2", "Z3"]
 SCORE_MIN = 0
 SCORE_MAX = 3
 
+# Dimensions with a plain --agg_<dim> flag (τ has its own unicode/ascii pair)
+AGG_DIMS = ("Cx", "K", "G", "D")
+# Derived once at import (read-only): argparse dests and the --bottleneck mode map
+_AGG_ATTRS = tuple((d, f"agg_{d}") for d in AGG_DIMS)
+_BOTTLENECK_MODES = dict.fromkeys(AGG_DIMS + ("τ", "tau"), "bottleneck")
+_TAU_ALIAS = {"τ": "tau", "tau": "τ"}
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity that json accepts (then refused by the int-only
+            # validation): the stdlib decides, so errors read the same with or without orjson
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    # written files: stdlib encoder only (orjson spells some floats differently), so
+    # results.json bytes do not depend on which optional packages are installed
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 def _tau_label() -> str:
     # prefer unicode tau unless forced to ASCII
@@ -28,8 +63,7 @@ def _tau_label() -> str:
     return "tau" if force_ascii else "τ"
 
 
-def build_template(name: str = "Template", description: str = "pytest template") -> Dict[str, Any]:
-    tau = _tau_label()
+def _template_payload(name: str, description: str, tau: str) -> Dict[str, Any]:
     dims = ["Cx", "K", tau, "G", "D"]
     items = []
     for d in dims:
@@ -47,15 +81,37 @@ def build_template(name: str = "Template", description: str = "pytest template")
     }
 
 
+def build_template(name: str = "Template", description: str = "pytest template") -> Dict[str, Any]:
+    return _template_payload(name, description, _tau_label())
+
+
+_TEMPLATE_NAME_PLACEHOLDER = "__PHIO_TEMPLATE_NAME__"
+
+
+@functools.lru_cache(maxsize=2)
+def _template_bytes(tau: str) -> bytes:
+    # serialized once per tau label; only system.name varies between calls
+    tpl = _template_payload(_TEMPLATE_NAME_PLACEHOLDER, "pytest template", tau)
+    return json.dumps(tpl, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def render_template(name: str = "Template") -> bytes:
+    """new-template output (same bytes as serializing build_template(name))."""
+    placeholder = json.dumps(_TEMPLATE_NAME_PLACEHOLDER).encode("utf-8")
+    return _template_bytes(_tau_label()).replace(placeholder, json.dumps(name, ensure_ascii=False).encode("utf-8"), 1)
+
+
 def _is_int_strict(x: Any) -> bool:
     # reject bools (bool is subclass of int)
     return isinstance(x, int) and not isinstance(x, bool)
 
 
-def validate_input(data: Dict[str, Any]) -> None:
+def _validate_and_bucket(data: Dict[str, Any]) -> Dict[str, List[float]]:
+    # single pass over items: strict validation + per-dimension buckets
     items = data.get("items", None)
     if not isinstance(items, list) or not items:
         raise ValueError("input.items absent ou vide")
+    buckets: Dict[str, List[float]] = {}
     for idx, it in enumerate(items):
         if not isinstance(it, dict):
             raise ValueError(f"item[{idx}] doit être un objet")
@@ -71,6 +127,72 @@ def validate_input(data: Dict[str, Any]) -> None:
             raise ValueError(f"item[{idx}].score doit être int-only (reçu: {type(sc).__name__})")
         if sc < SCORE_MIN or sc > SCORE_MAX:
             raise ValueError(f"item[{idx}].score hors borne [{SCORE_MIN},{SCORE_MAX}]: {sc}")
+        vals = buckets.get(dim)
+        if vals is None:
+            buckets[dim] = [float(sc)]
+        else:
+            vals.append(float(sc))
+    return buckets
+
+
+def validate_input(data: Dict[str, Any]) -> None:
+    _validate_and_bucket(data)
+
+
+if msgspec is not None:
+
+    class _Item(msgspec.Struct):
+        # unknown keys (weight, justification, ...) are ignored, as in the dict path
+        dimension: str
+        score: int  # msgspec int rejects bool and float, like _is_int_strict
+
+    class _ScoreInput(msgspec.Struct):
+        items: List[_Item]
+
+
+def _decode_and_bucket(raw: bytes) -> Optional[Dict[str, List[float]]]:
+    # Fast path only: None on any rejection, so the caller reruns the stdlib
+    # path and reports the exact contract error message.
+    if msgspec is None:
+        return None
+    try:
+        items = msgspec.json.decode(raw, type=_ScoreInput).items
+    except msgspec.MsgspecError:
+        return None
+    if not items:
+        return None
+    buckets: Dict[str, List[float]] = {}
+    for it in items:
+        dim, sc = it.dimension, it.score
+        if not dim.strip() or sc < SCORE_MIN or sc > SCORE_MAX:
+            return None
+        vals = buckets.get(dim)
+        if vals is None:
+            buckets[dim] = [float(sc)]
+        else:
+            vals.append(float(sc))
+    return buckets
+
+
+# Validated scores are ints SCORE_MIN..SCORE_MAX: the median is read off a count per value
+_SCORE_VALUES = tuple(float(s) for s in range(SCORE_MIN, SCORE_MAX + 1))
+
+
+def _median(values: List[float]) -> float:
+    n = len(values)
+    counts = [values.count(v) for v in _SCORE_VALUES]  # one C-level pass per value, no sort
+    if sum(counts) != n:  # other values (aggregate_dimension_scores takes unvalidated items)
+        return float(median(values))
+    lo_rank, hi_rank = (n - 1) // 2, n // 2
+    lo = None
+    seen = 0
+    for v, c in zip(_SCORE_VALUES, counts):
+        seen += c
+        if lo is None and seen > lo_rank:
+            lo = v
+        if seen > hi_rank:
+            return v if lo == v else (lo + v) / 2
+    raise AssertionError("unreachable: counts sum to n")
 
 
 def _agg(values: List[float], mode: str) -> float:
@@ -80,15 +202,11 @@ def _agg(values: List[float], mode: str) -> float:
     if m == "bottleneck":
         return float(min(values))
     # default median
-    return float(median(values))
+    return _median(values)
 
 
 def _normalize_tau_label(dim: str) -> str:
-    if dim == "τ":
-        return "tau"
-    if dim == "tau":
-        return "τ"
-    return dim
+    return _TAU_ALIAS.get(dim, dim)
 
 
 def aggregate_dimension_scores(data: Dict[str, Any], agg_modes: Dict[str, str]) -> Dict[str, float]:
@@ -97,9 +215,18 @@ def aggregate_dimension_scores(data: Dict[str, Any], agg_modes: Dict[str, str])
         dim = it.get("dimension")
         if not dim:
             continue
+        key = str(dim)
         sc = float(it.get("score", 0))
-        buckets.setdefault(str(dim), []).append(sc)
+        # no setdefault(key, []): avoids allocating a throwaway list per item
+        vals = buckets.get(key)
+        if vals is None:
+            buckets[key] = [sc]
+        else:
+            vals.append(sc)
+    return _aggregate_buckets(buckets, agg_modes)
+
 
+def _aggregate_buckets(buckets: Dict[str, List[float]], agg_modes: Dict[str, str]) -> Dict[str, float]:
     out: Dict[str, float] = {}
     for dim, vals in buckets.items():
         mode = agg_modes.get(dim) or agg_modes.get(_normalize_tau_label(dim)) or "median"
@@ -108,30 +235,29 @@ def aggregate_dimension_scores(data: Dict[str, Any], agg_modes: Dict[str, str])
 
 
 def compute_metrics(dims: Dict[str, float]) -> Tuple[float, float]:
-    tau_val = float(dims.get("τ", dims.get("tau", 0.0)))
-    Cx = float(dims.get("Cx", 0.0))
-    K = float(dims.get("K", 0.0))
-    G = float(dims.get("G", 0.0))
-    D = float(dims.get("D", 0.0))
-
+    # values come from _agg (already floats); τ wins over the ascii alias, even when 0.0
+    tau_val = dims["τ"] if "τ" in dims else dims.get("tau", 0.0)
+    Cx = dims.get("Cx", 0.0)
+    K = dims.get("K", 0.0)
+    G = dims.get("G", 0.0)
+    D = dims.get("D", 0.0)
+
+    # scores are bounded to [SCORE_MIN, SCORE_MAX] >= 0, so denom >= 1
     denom = 1.0 + tau_val + G + D + Cx
-    K_eff = K / denom if denom != 0 else 0.0
+    K_eff = K / denom
     T = Cx + tau_val + G + D - K_eff
     return T, K_eff
 
 
 def assign_zone(T: float) -> str:
-    t0, t1, t2 = ZONE_THRESHOLDS
-    if T <= t0:
-        return ZONE_LABELS[0]
-    if T <= t1:
-        return ZONE_LABELS[1]
-    if T <= t2:
-        return ZONE_LABELS[2]
-    return ZONE_LABELS[3]
+    # bisect_left keeps intervals right-closed: T == t_i falls in zone i.
+    # Reads ZONE_THRESHOLDS at call time, so a patched or reassigned list is honoured.
+    return ZONE_LABELS[bisect.bisect_left(ZONE_THRESHOLDS, T)]
 
 
-def parse_args(argv: List[str]) -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    # Built once per process: holds no per-call state (parse_args returns a fresh Namespace).
     p = argparse.ArgumentParser(
         prog="phi_otimes_o_instrument_v0_1",
         description="PhiO instrument CLI (contract-driven).",
@@ -146,13 +272,39 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     sp_s.add_argument("--input", required=True, help="Input JSON path")
     sp_s.add_argument("--outdir", required=True, help="Output directory")
 
-    for d in ["Cx", "K", "G", "D"]:
+    for d in AGG_DIMS:
         sp_s.add_argument(f"--agg_{d}", default="median", help=f"Aggregation for {d} (median|bottleneck)")
     sp_s.add_argument("--agg_τ", dest="agg_tau_unicode", default=None, help="Aggregation for τ (median|bottleneck)")
     sp_s.add_argument("--agg_tau", dest="agg_tau_ascii", default=None, help="Aggregation for tau (median|bottleneck)")
     sp_s.add_argument("--bottleneck", action="store_true", help="Alias: set all aggregations to bottleneck")
 
-    return p.parse_args(argv)
+    return p
+
+
+@functools.lru_cache(maxsize=1)
+def build_help_parser() -> argparse.ArgumentParser:
+    # Flat parser used only for top-level --help (lists score flags at top level for contract probes).
+    parser = argparse.ArgumentParser(
+        prog="phi_otimes_o_instrument_v0_1",
+        description="PhiO instrument CLI (contract-driven).",
+    )
+    sub = parser.add_subparsers(dest="cmd")
+    sub.add_parser("new-template", help="Generate a pytest template JSON")
+    sub.add_parser("score", help="Score an input JSON and write results.json to outdir")
+    parser.add_argument("--input", help="(score) input JSON")
+    parser.add_argument("--outdir", help="(score) output directory")
+    parser.add_argument("--agg_Cx", help="Aggregation for Cx")
+    parser.add_argument("--agg_K", help="Aggregation for K")
+    parser.add_argument("--agg_G", help="Aggregation for G")
+    parser.add_argument("--agg_D", help="Aggregation for D")
+    parser.add_argument("--agg_τ", help="Aggregation for τ")
+    parser.add_argument("--agg_tau", help="Aggregation for tau")
+    parser.add_argument("--bottleneck", help="Use bottleneck aggregation")
+    return parser
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    return build_parser().parse_args(argv)
 
 
 def main(argv: List[str] | None = None) -> int:
@@ -161,56 +313,33 @@ def main(argv: List[str] | None = None) -> int:
     argv = list(sys.argv[1:] if argv is None else argv)
 
     if not argv or argv == ["--help"] or argv == ["-h"]:
-        parser = argparse.ArgumentParser(
-            prog="phi_otimes_o_instrument_v0_1",
-            description="PhiO instrument CLI (contract-driven).",
-        )
-        sub = parser.add_subparsers(dest="cmd")
-        sub.add_parser("new-template", help="Generate a pytest template JSON")
-        sub.add_parser("score", help="Score an input JSON and write results.json to outdir")
-        parser.add_argument("--input", help="(score) input JSON")
-        parser.add_argument("--outdir", help="(score) output directory")
-        parser.add_argument("--agg_Cx", help="Aggregation for Cx")
-        parser.add_argument("--agg_K", help="Aggregation for K")
-        parser.add_argument("--agg_G", help="Aggregation for G")
-        parser.add_argument("--agg_D", help="Aggregation for D")
-        parser.add_argument("--agg_τ", help="Aggregation for τ")
-        parser.add_argument("--agg_tau", help="Aggregation for tau")
-        parser.add_argument("--bottleneck", help="Use bottleneck aggregation")
-        parser.print_help()
+        build_help_parser().print_help()
         return 0
 
     args = parse_args(argv)
 
     try:
         if args.cmd == "new-template":
-            tpl = build_template(name=args.name)
             outp = Path(args.out)
             outp.parent.mkdir(parents=True, exist_ok=True)
-            outp.write_text(json.dumps(tpl, ensure_ascii=False, indent=2), encoding="utf-8")
+            outp.write_bytes(render_template(args.name))
             return 0
 
         if args.cmd == "score":
             inp = Path(args.input)
-            data = json.loads(inp.read_text(encoding="utf-8"))
+            raw = inp.read_bytes()
 
-            validate_input(data)
-
-            agg_modes = {
-                "Cx": getattr(args, "agg_Cx", "median"),
-                "K": getattr(args, "agg_K", "median"),
-                "G": getattr(args, "agg_G", "median"),
-                "D": getattr(args, "agg_D", "median"),
-            }
-            tau_mode = args.agg_tau_unicode or args.agg_tau_ascii or "median"
-            agg_modes["τ"] = tau_mode
-            agg_modes["tau"] = tau_mode
+            buckets = _decode_and_bucket(raw)
+            if buckets is None:
+                buckets = _validate_and_bucket(_json_loads(raw))
 
-            if getattr(args, "bottleneck", False):
-                for k in list(agg_modes.keys()):
-                    agg_modes[k] = "bottleneck"
+            if args.bottleneck:
+                agg_modes = _BOTTLENECK_MODES  # only read by _aggregate_buckets
+            else:
+                agg_modes = {d: getattr(args, attr) for d, attr in _AGG_ATTRS}
+                agg_modes["τ"] = agg_modes["tau"] = args.agg_tau_unicode or args.agg_tau_ascii or "median"
 
-            dim_scores = aggregate_dimension_scores(data, agg_modes)
+            dim_scores = _aggregate_buckets(buckets, agg_modes)
             T, K_eff = compute_metrics(dim_scores)
             zone = assign_zone(T)
 
@@ -223,7 +352,7 @@ def main(argv: List[str] | None = None) -> int:
                 "K_eff": K_eff,
                 "zone": zone,
             }
-            (outdir / "results.json").write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding="utf-8")
+            (outdir / "results.json").write_bytes(_json_dumps(out))
             return 0
 
         return 2
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """
 validate_traceability.py
-- Validates traceability_cases.json against basic invariants (no external deps).
+- Validates traceability_cases.json against basic invariants (no external deps;
+  `orjson` is used for the whole-file parse when installed).
 - Intended to be run in CI / locally.
+- Large files are streamed case by case when the optional `ijson` is installed
+  (bounded memory, stops at the first violation without parsing the tail).
 
 Exit codes:
  0 = OK
@@ -12,32 +15,90 @@ Exit codes:
 from __future__ import annotations
 import json, sys, os, re
 
+try:  # optional: faster whole-file parser, fed bytes directly
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # optional: streaming parser for large files; json.load stays the reference path
+    import ijson
+except ImportError:  # pragma: no cover - depends on environment
+    ijson = None
+
+# Below this size a whole-file json.load is faster than event-driven streaming
+STREAM_MIN_BYTES = 8 * 1024 * 1024
+
 ALLOWED_VERDICTS = {"INCOMPATIBLE","INCONCLUSIF","COMPATIBLE_PARTIELLE","COMPATIBLE"}
+CASE_ID_RE = re.compile(r"[0-9]{4}")
 
 def die(code:int, msg:str)->None:
     print(msg, file=sys.stderr)
     sys.exit(code)
 
 def is_vec(v, n):
-    return isinstance(v, list) and len(v)==n and all(isinstance(x,int) and 0<=x<=2 for x in v)
+    # bytes(list) checks "int in 0..255" for every element in C (TypeError/ValueError
+    # otherwise); only the upper bound 2 is left to check
+    if not isinstance(v, list) or len(v) != n:
+        return False
+    try:
+        b = bytes(v)
+    except (TypeError, ValueError):
+        return False
+    return not b or max(b) <= 2
 
-def main(path:str)->int:
+def _load_whole(path:str):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(path, "rb") as f:
+                raw = f.read()
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN, >64-bit ints, ...: json.loads decides (same verdicts and messages)
+            text = raw.decode("utf-8")
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        return json.loads(text)
     except Exception as e:
         die(2, f"ERROR: cannot read/parse {path}: {e}")
 
-    if not isinstance(data, list):
-        die(3, "ERROR: root must be a JSON array")
+def iter_cases(path:str):
+    """Yields the root array's cases; exit 2 on read/parse errors, 3 if the root is not an array."""
+    try:
+        size = os.path.getsize(path)
+    except OSError as e:
+        die(2, f"ERROR: cannot read/parse {path}: {e}")
+
+    if ijson is None or size < STREAM_MIN_BYTES:
+        data = _load_whole(path)
+        if not isinstance(data, list):
+            die(3, "ERROR: root must be a JSON array")
+        yield from data
+        return
+
+    try:
+        with open(path, "rb") as f:
+            events = ijson.parse(f)
+            first = next(events, None)
+            if first is None or first[1] != "start_array":
+                if first is not None:
+                    die(3, "ERROR: root must be a JSON array")
+                raise ValueError("empty document")
+            yield from ijson.items(events, "item")
+    except (ijson.JSONError, OSError, ValueError) as e:
+        die(2, f"ERROR: cannot read/parse {path}: {e}")
 
+def main(path:str)->int:
     seen = set()
-    for i, case in enumerate(data):
+    n = 0
+    for i, case in enumerate(iter_cases(path)):
+        n += 1
         if not isinstance(case, dict):
             die(3, f"ERROR: case[{i}] must be an object")
 
         cid = case.get("case_id")
-        if not isinstance(cid, str) or not re.fullmatch(r"[0-9]{4}", cid):
+        if not isinstance(cid, str) or not CASE_ID_RE.fullmatch(cid):
             die(3, f"ERROR: case[{i}].case_id must be 4 digits")
         if cid in seen:
             die(3, f"ERROR: duplicate case_id: {cid}")
@@ -66,7 +127,7 @@ def main(path:str)->int:
         if verdict not in ALLOWED_VERDICTS:
             die(3, f"ERROR: case[{i}].verdict_E must be one of {sorted(ALLOWED_VERDICTS)}")
 
-    print(f"OK: {len(data)} cases validated ({path})")
+    print(f"OK: {n} cases validated ({path})")
     return 0
 
 if __name__ == "__main__":
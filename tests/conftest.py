@@ -1,20 +1,49 @@
+import contextlib
+import io
 import json
 import os
 import subprocess
-import tempfile
+import sys
+import traceback
 from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
 from typing import Iterator, Optional
 
 import pytest
 
+import contract_probe  # racine du dépôt (sur sys.path: rootdir de pytest)
+
 from .config import INSTRUMENT_PATH
+from .contracts import extract_zone_thresholds_ast
 
 
 def _run(cmd, cwd=None) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", cwd=cwd)
 
 
+def _run_in_process(mod: ModuleType, cmd) -> subprocess.CompletedProcess:
+    """Appelle mod.main(argv) en capturant stdout/stderr, avec la sémantique d'un process.
+
+    - SystemExit (argparse --help / erreurs de parsing) -> returncode équivalent
+    - exception non rattrapée -> returncode 1 + traceback sur stderr
+    """
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = mod.main(list(cmd[2:]))
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                rc = e.code or 0
+            else:
+                err.write(f"{e.code}\n")
+                rc = 1
+        except Exception:
+            traceback.print_exc(file=err)
+            rc = 1
+    return subprocess.CompletedProcess(cmd, int(rc or 0), out.getvalue(), err.getvalue())
+
+
 @dataclass
 class CLIResult:
     """Résultat CLI compatible avec deux patterns de tests.
@@ -63,14 +92,50 @@ def instrument_path():
     return str(INSTRUMENT_PATH)
 
 
+@pytest.fixture(scope="session")
+def instrument_module(instrument_path) -> Optional[ModuleType]:
+    """Instrument importé une fois par session pour les appels in-process.
+
+    PHIO_SUBPROCESS=1 force l'exécution boîte noire (un process par appel).
+    """
+    if os.getenv("PHIO_SUBPROCESS", "0").strip() == "1":
+        return None
+    # importé par contract_probe (dossier de l'instrument sur sys.path le temps de l'import)
+    return contract_probe.load_instrument_module(Path(instrument_path))
+
+
+@pytest.fixture(scope="session")
+def instrument_impl(instrument_module) -> ModuleType:
+    """Module qui implémente l'instrument (le shim racine ne ré-exporte que main()).
+
+    Skip si l'instrument n'est pas importable in-process.
+    """
+    if instrument_module is None:
+        pytest.skip("instrument non importable in-process")
+    return sys.modules.get(getattr(instrument_module.main, "__module__", ""), instrument_module)
+
+
+@pytest.fixture(scope="session")
+def probe() -> ModuleType:
+    """contract_probe.py de la racine, importé normalement (une seule copie par session)."""
+    return contract_probe
+
+
+@pytest.fixture(scope="session")
+def zone_thresholds():
+    """Résultat d'extract_zone_thresholds_ast sur l'instrument, calculé une fois par session."""
+    return extract_zone_thresholds_ast(str(INSTRUMENT_PATH))
+
+
 @pytest.fixture
-def run_cli(tmp_path, instrument_path):
+def run_cli(tmp_path, instrument_path, instrument_module):
     """Exécute le CLI comme une boîte noire.
 
     - Si input_json est fourni, on injecte automatiquement --input <tmpfile>
       (ou on remplace l'argument existant de --input).
     - Pour la commande score, on force --outdir si absent.
     - Retour: CLIResult (proxy CompletedProcess + outdir, itérable).
+    - Par défaut main(argv) est appelé in-process; PHIO_SUBPROCESS=1 pour un vrai process.
     """
 
     def _runner(args, input_json=None, outdir=None) -> CLIResult:
@@ -81,11 +146,10 @@ def run_cli(tmp_path, instrument_path):
 
         tmp_input: Optional[Path] = None
         if input_json is not None:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".json", delete=False, encoding="utf-8"
-            ) as f:
+            # reuse the test's tmp_path (already created) rather than a new temp file per call
+            tmp_input = tmp_path / "input.json"
+            with tmp_input.open("w", encoding="utf-8") as f:
                 json.dump(input_json, f, ensure_ascii=False, indent=2)
-                tmp_input = Path(f.name)
 
             # Replace existing --input target if present; otherwise inject --input <file>
             if "--input" in cmd:
@@ -109,10 +173,7 @@ def run_cli(tmp_path, instrument_path):
         if "score" in cmd and ("--outdir" not in cmd):
             cmd += ["--outdir", str(outdir_p)]
 
-        proc = _run(cmd)
-
-        if tmp_input and tmp_input.exists():
-            tmp_input.unlink(missing_ok=True)
+        proc = _run_in_process(instrument_module, cmd) if instrument_module is not None else _run(cmd)
 
         return CLIResult(proc=proc, outdir=outdir_p)
 
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 import ast
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+
+# (mtime_ns, taille) de ce fichier à l'import: contract_probe.py réutilise ce module
+# déjà importé tant que le fichier n'a pas changé depuis
+try:
+    _st = os.stat(__file__)
+    _SOURCE_STAT: Optional[Tuple[int, int]] = (_st.st_mtime_ns, _st.st_size)
+    del _st
+except OSError:  # pragma: no cover
+    _SOURCE_STAT = None
 
 
 def extract_zone_thresholds_ast(instrument_path: str) -> Optional[Dict[str, Any]]:
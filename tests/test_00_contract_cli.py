@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import os
+import re
+import stat
 import sys
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -10,10 +13,15 @@ import pytest
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
+# very tolerant keywords, one pass over the raw output (no lowercased copy)
+_KW_RE = re.compile(r"contract|manifest|trace|ddr|e_report|schema", re.IGNORECASE)
 
-def _candidate_clis() -> list[Path]:
+
+@lru_cache(maxsize=1)
+def _candidate_clis() -> tuple[Path, ...]:
     """
     Candidates ordered from most explicit to most heuristic.
+    Computed once per session (PHIO_CLI is read at first use).
     """
     # 1) explicit override (best)
     env_path = os.environ.get("PHIO_CLI", "").strip()
@@ -21,10 +29,10 @@ def _candidate_clis() -> list[Path]:
         p = Path(env_path)
         if not p.is_absolute():
             p = (REPO_ROOT / p).resolve()
-        return [p]
+        return (p,)
 
     # 2) common names in repo root / scripts
-    candidates = [
+    candidates = (
         REPO_ROOT / "phio.py",
         REPO_ROOT / "cli.py",
         REPO_ROOT / "contract_probe.py",
@@ -32,17 +40,32 @@ def _candidate_clis() -> list[Path]:
         REPO_ROOT / "scripts" / "phio.py",
         REPO_ROOT / "scripts" / "cli.py",
         REPO_ROOT / "scripts" / "contract_probe.py",
-    ]
+    )
     return candidates
 
 
+@lru_cache(maxsize=1)
 def _pick_cli() -> Path | None:
     for p in _candidate_clis():
-        if p.exists() and p.is_file():
+        # one stat() per candidate (exists() + is_file() issued two)
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
             return p
     return None
 
 
+@lru_cache(maxsize=1)
+def _cli_env() -> dict[str, str]:
+    """
+    Environment for CLI subprocesses, built once per session (os.environ is copied once,
+    not per call). Read-only: subprocess.run never mutates it.
+    """
+    return {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+
+
 def _run_cli(cli: Path, *args: str) -> subprocess.CompletedProcess[str]:
     """
     Runs the CLI in a way that does NOT require executable bit nor shebang.
@@ -54,40 +77,44 @@ def _run_cli(cli: Path, *args: str) -> subprocess.CompletedProcess[str]:
         cwd=str(REPO_ROOT),
         capture_output=True,
         text=True,
-        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        env=_cli_env(),
     )
 
 
-def test_cli_help_runs():
+@pytest.fixture(scope="session")
+def cli_path() -> Path | None:
+    """CLI entrypoint resolved once per session (None if none is found)."""
+    return _pick_cli()
+
+
+@pytest.fixture(scope="session")
+def cli_help_result(cli_path) -> subprocess.CompletedProcess[str]:
     """
-    Contract-level smoke: help should run without crashing.
-    If no CLI is declared/found, we SKIP (not fail), because it's optional.
+    `<cli> --help`, run in a single subprocess shared by the help tests.
+    If no CLI is declared/found, dependent tests SKIP (not fail), because it's optional.
     """
-    cli = _pick_cli()
-    if cli is None:
+    if cli_path is None:
         pytest.skip("No CLI entrypoint found. Set PHIO_CLI to enable this test.")
+    return _run_cli(cli_path, "--help")
+
 
-    res = _run_cli(cli, "--help")
+def test_cli_help_runs(cli_help_result):
+    """
+    Contract-level smoke: help should run without crashing.
+    """
+    res = cli_help_result
     # accept 0 or 2 for argparse-style help exits depending on implementation
     assert res.returncode in (0, 2), f"CLI help failed.\nSTDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
 
 
-def test_cli_help_mentions_contract_wording():
+def test_cli_help_mentions_contract_wording(cli_path, cli_help_result):
     """
     Soft assertion: help output should mention contract-ish wording.
     Keep it tolerant to avoid false negatives.
     """
-    cli = _pick_cli()
-    if cli is None:
-        pytest.skip("No CLI entrypoint found. Set PHIO_CLI to enable this test.")
-
-    res = _run_cli(cli, "--help")
-    out = (res.stdout + "\n" + res.stderr).lower()
-
-    # very tolerant keywords
-    keywords = ["contract", "manifest", "trace", "ddr", "e_report", "schema"]
-    assert any(k in out for k in keywords), (
+    res = cli_help_result
+    assert _KW_RE.search(res.stdout) or _KW_RE.search(res.stderr), (
         "CLI help output does not look like a contract/trace tool.\n"
-        f"Used CLI: {cli}\n"
+        f"Used CLI: {cli_path}\n"
         f"Output:\n{res.stdout}\n{res.stderr}"
     )
@@ -32,6 +32,14 @@ def test_reject_float_score(run_cli, template_json):
     res, _ = run_cli(["score", "--input", "placeholder"], input_json=invalid)
     assert res.returncode != 0, "Score float accepté (v0.1 attend int-only)"
 
+@pytest.mark.parametrize("bad_score", [float("nan"), float("inf")])
+def test_reject_non_finite_score_with_int_only_message(run_cli, template_json, bad_score):
+    # json.dump écrit NaN/Infinity: même message int-only avec ou sans orjson
+    invalid = _mutate_first_item(template_json, score=bad_score)
+    res, _ = run_cli(["score", "--input", "placeholder"], input_json=invalid)
+    assert res.returncode != 0, "Score non fini accepté (v0.1 attend int-only)"
+    assert "int-only" in (res.stderr or ""), res.stderr
+
 def test_reject_missing_dimension_key(run_cli, template_json):
     import copy
     invalid = copy.deepcopy(template_json)
@@ -1,4 +1,6 @@
 import re
+import statistics
+
 import pytest
 
 def _supports_bottleneck(help_text: str) -> bool:
@@ -28,3 +30,21 @@ def test_bottleneck_dominance_if_supported(run_cli, template_json, load_results)
 
     assert float(b["T"]) >= float(m["T"]), "bottleneck devrait être >= median sur T"
     assert float(b["K_eff"]) <= float(m["K_eff"]), "bottleneck devrait être <= median sur K_eff"
+
+
+def test_median_aggregation_matches_statistics_median(instrument_impl):
+    """La médiane (comptage par score entier) égale statistics.median, scores valides ou non."""
+    aggregate = getattr(instrument_impl, "aggregate_dimension_scores", None)
+    if aggregate is None:
+        pytest.skip("aggregate_dimension_scores non exposé par l'instrument")
+
+    cases = {
+        "impair": [3, 0, 2, 2, 1],
+        "pair": [0, 3, 1, 3],
+        "pair_meme_valeur": [2, 1, 2, 3],
+        "hors_bornes": [0.5, 3, 7, 1],  # entrée non validée: repli statistics.median
+    }
+    items = [{"dimension": dim, "score": sc} for dim, scores in cases.items() for sc in scores]
+    got = aggregate({"items": items}, {})
+    for dim, scores in cases.items():
+        assert got[dim] == float(statistics.median(scores)), dim
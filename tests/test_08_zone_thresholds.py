@@ -1,19 +1,45 @@
 import pytest
 
-from .config import INSTRUMENT_PATH
-from .contracts import extract_zone_thresholds_ast
-
-def test_zone_thresholds_extractable_or_explicitly_absent():
+def test_zone_thresholds_extractable_or_explicitly_absent(zone_thresholds):
     """Contrat: si le zonage existe, il doit être extractible (ou déclaré non-stable).
 
     Ce test est volontairement conservateur:
     - PASS si on extrait un objet seuils/mapping plausible
     - XFAIL si rien n'est détecté (signal de non-contractualisation)
     """
-    info = extract_zone_thresholds_ast(str(INSTRUMENT_PATH))
+    info = zone_thresholds
     if info is None:
         pytest.xfail("Seuils de zone non extractibles via heuristique AST (contrat non explicité).")
     # Minimal structure check
     assert isinstance(info, dict)
     assert "pattern" in info
     assert any(k in info for k in ("thresholds", "mapping"))
+
+
+def test_assign_zone_boundaries_are_right_closed(instrument_impl):
+    """Intervalles (-inf, t0] (t0, t1] (t1, t2] (t2, +inf): une valeur égale au seuil reste dans la zone basse."""
+    assign_zone = getattr(instrument_impl, "assign_zone", None)
+    thresholds = getattr(instrument_impl, "ZONE_THRESHOLDS", None)
+    labels = getattr(instrument_impl, "ZONE_LABELS", None)
+    if assign_zone is None or thresholds is None or labels is None:
+        pytest.skip("assign_zone/ZONE_THRESHOLDS/ZONE_LABELS non exposés par l'instrument")
+
+    eps = 1e-9
+    assert assign_zone(thresholds[0] - 1.0) == labels[0]
+    for i, t in enumerate(thresholds):
+        assert assign_zone(t) == labels[i], f"T == seuil {t} doit rester en {labels[i]}"
+        assert assign_zone(t + eps) == labels[i + 1]
+    assert assign_zone(thresholds[-1] + 1.0) == labels[-1]
+
+
+def test_assign_zone_reads_current_thresholds(instrument_impl, monkeypatch):
+    """assign_zone lit ZONE_THRESHOLDS à l'appel: des seuils réassignés sont pris en compte."""
+    assign_zone = getattr(instrument_impl, "assign_zone", None)
+    labels = getattr(instrument_impl, "ZONE_LABELS", None)
+    if assign_zone is None or labels is None or getattr(instrument_impl, "ZONE_THRESHOLDS", None) is None:
+        pytest.skip("assign_zone/ZONE_THRESHOLDS/ZONE_LABELS non exposés par l'instrument")
+
+    shifted = [10.0 * (i + 1) for i in range(len(labels) - 1)]
+    monkeypatch.setattr(instrument_impl, "ZONE_THRESHOLDS", shifted)
+    assert assign_zone(shifted[0]) == labels[0]
+    assert assign_zone(shifted[-1] + 1.0) == labels[-1]
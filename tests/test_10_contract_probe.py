@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Unit tests for contract_probe.py, the baseline generator behind test_99."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+INSTRUMENT = REPO_ROOT / "phi_otimes_o_instrument_v0_1.py"
+
+
+def test_out_dash_streams_the_baseline_to_stdout(probe, tmp_path, capsysbinary):
+    out = tmp_path / "baseline.json"
+    assert probe.main(["--instrument", str(INSTRUMENT), "--out", str(out)]) == 0
+    capsysbinary.readouterr()
+
+    assert probe.main(["--instrument", str(INSTRUMENT), "--out", "-"]) == 0
+    streamed = capsysbinary.readouterr().out
+
+    assert not (REPO_ROOT / "-").exists(), "'-' must not be taken as a file name"
+    assert streamed.endswith(b"\n")
+    assert probe.strip_volatile(json.loads(streamed)) == probe.strip_volatile(json.loads(out.read_bytes()))
+
+
+def test_sha256_file_sees_a_same_size_edit_that_keeps_the_mtime(probe, tmp_path):
+    f = tmp_path / "instrument.py"
+    f.write_bytes(b"A = 1\n")
+    st = f.stat()
+    first = probe.sha256_file(f)
+    f.write_bytes(b"A = 2\n")
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))  # as `touch -r` or a checkout can
+    assert probe.sha256_file(f) == hashlib.sha256(b"A = 2\n").hexdigest() != first
+
+
+def test_probe_writes_no_disk_cache_by_default(probe, tmp_path, monkeypatch):
+    monkeypatch.delenv("PHIO_PROBE_CACHE", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    instrument = tmp_path / "instrument.py"  # fresh path: nothing memoized in-process yet
+    instrument.write_text("ZONE_THRESHOLDS = [0.5, 1.5]\n", encoding="utf-8")
+    assert probe.main(["--instrument", str(instrument), "--out", str(tmp_path / "baseline.json")]) == 0
+    assert not (tmp_path / "cache").exists()
+
+
+def test_stable_json_bytes_do_not_depend_on_orjson(probe, monkeypatch):
+    if probe.orjson is None:
+        pytest.skip("orjson not installed: only the stdlib encoder is available")
+    # floats that orjson and the stdlib spell differently when they serialize them
+    doc = {
+        "validation_timestamp": "2026-01-01T00:00:00+00:00",
+        "zones": {"zones": {"0": 1e-05, "1": 0.5, "2": 1e16, "3": -0.0}, "method": "internal_ast_assign"},
+        "cli": {"flags": ["--agg_τ"], "_forensics": {"cmd": ["/usr/bin/python"], "returncode": 0}},
+    }
+    with_orjson = probe.stable_json_bytes(doc)
+    monkeypatch.setattr(probe, "orjson", None)
+    assert probe.stable_json_bytes(doc) == with_orjson
+    assert json.loads(with_orjson) == probe.strip_volatile(doc)
+
+
+def test_stable_flag_writes_stable_json_bytes(probe, tmp_path, capsysbinary):
+    out = tmp_path / "baseline.json"
+    assert probe.main(["--instrument", str(INSTRUMENT), "--out", str(out)]) == 0
+    capsysbinary.readouterr()
+    assert probe.main(["--instrument", str(INSTRUMENT), "--out", "-", "--stable"]) == 0
+    assert capsysbinary.readouterr().out == probe.stable_json_bytes(json.loads(out.read_bytes()))
+
+
+def test_load_instrument_module_leaves_sys_path_alone(probe, tmp_path, monkeypatch):
+    (tmp_path / "helper_mod.py").write_text("VALUE = 1\n", encoding="utf-8")
+    ok = tmp_path / "ok.py"
+    ok.write_text("import helper_mod\n\ndef main(argv):\n    return helper_mod.VALUE\n", encoding="utf-8")
+    exits = tmp_path / "exits.py"
+    exits.write_text("import sys\nsys.exit(3)\n", encoding="utf-8")
+    monkeypatch.delitem(sys.modules, "helper_mod", raising=False)
+    before = list(sys.path)
+
+    assert probe.load_instrument_module(ok) is not None  # sibling import resolved
+    assert probe.load_instrument_module(exits) is None  # SystemExit at import time
+    assert sys.path == before
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("ZONE_BOUNDS = (0.5, -1)\n", {"thresholds": [0.5, -1.0], "pattern": "assign", "name": "ZONE_BOUNDS"}),
+        (
+            "ZONE_MAP = {'a': 1}\nZONING: dict = {'x': 'y', 'z': 'w'}\n",
+            {"pattern": "annassign:ZONING", "mapping": {"x": "y", "z": "w"}},
+        ),
+        (
+            "def zone_of(T):\n    if T < 1:\n        zone = 'low'\n    elif T < 2:\n        zone = 'mid'\n    return zone\n",
+            {"thresholds": [1.0, 2.0], "zones": ["low", "mid"], "pattern": "if_chain"},
+        ),
+        (
+            "ZONE_THRESHOLDS = [1, 2.5]\ndef broken(:\n",
+            {"thresholds": [1.0, 2.5], "pattern": "fallback_regex", "name": "ZONE_THRESHOLDS"},
+        ),
+        ("ZONES = [True]\nX = 1\n", None),
+    ],
+    ids=["candidate_name", "largest_dict", "if_chain", "regex_fallback", "nothing"],
+)
+def test_describe_zones(probe, tmp_path, source, expected):
+    f = tmp_path / "instrument.py"
+    f.write_text(source, encoding="utf-8")
+    assert probe.describe_zones(f) == expected
+
+
+def test_describe_zones_returns_a_copy_and_clear_describe_caches_rereads(probe, tmp_path):
+    f = tmp_path / "instrument.py"
+    f.write_bytes(b"ZONES = [1, 2]\n")
+    st = f.stat()
+    first = probe.describe_zones(f)
+    first["thresholds"].append(99.0)
+    assert probe.describe_zones(f)["thresholds"] == [1.0, 2.0]
+
+    f.write_bytes(b"ZONES = [3, 4]\n")
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))  # same (mtime, size): memoized result
+    assert probe.describe_zones(f)["thresholds"] == [1.0, 2.0]
+    probe.clear_describe_caches()
+    assert probe.describe_zones(f)["thresholds"] == [3.0, 4.0]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scripts import validate_traceability
+
+
+CASES = Path(__file__).resolve().parents[1] / "traceability_cases.json"
+
+
+@pytest.fixture
+def streaming(monkeypatch):
+    """validate_traceability with the ijson path forced for every file size."""
+    if validate_traceability.ijson is None:
+        pytest.skip("ijson not installed")
+    monkeypatch.setattr(validate_traceability, "STREAM_MIN_BYTES", 0)
+    return validate_traceability
+
+
+def test_streaming_case_count_matches_whole_file(streaming, monkeypatch):
+    streamed = list(streaming.iter_cases(str(CASES)))
+    monkeypatch.setattr(streaming, "STREAM_MIN_BYTES", float("inf"))
+    whole = list(streaming.iter_cases(str(CASES)))
+    assert whole, "traceability_cases.json has no cases"
+    assert len(streamed) == len(whole)
+    assert [c["case_id"] for c in streamed] == [c["case_id"] for c in whole]
+
+
+@pytest.mark.parametrize(
+    ("content", "code"),
+    [
+        pytest.param('{"case_id": "0001"}', 3, id="non-array-root"),
+        pytest.param("", 2, id="empty-file"),
+    ],
+)
+def test_streaming_exit_codes(streaming, tmp_path, content, code):
+    path = tmp_path / "cases.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        list(streaming.iter_cases(str(path)))
+    assert exc.value.code == code
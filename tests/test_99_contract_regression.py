@@ -4,76 +4,150 @@
 """Baseline regression test for PhiO contract.
 
 Policy:
-- Baseline stored at .contract/contract_baseline.json
+- Baseline stored at .contract/contract_baseline.json, digests in .contract/contract_baseline.sha256
 - If PHIO_UPDATE_BASELINE=true, the test regenerates baseline via contract_probe.py and overwrites it.
-- Otherwise, the test compares a canonicalized version of the baseline against a freshly generated one,
-  ignoring volatile fields (timestamps, paths).
+- Otherwise, the test compares the baseline against the probe's `--stable` output for
+  phi_otimes_o_instrument_v0_1.py (volatile fields such as timestamps and paths dropped,
+  canonical key-sorted bytes), then as objects.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import io
 import json
 import os
 import subprocess
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 
+try:  # optional: faster JSON parse, stdlib json stays the reference path
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 
 BASELINE_PATH = Path(".contract") / "contract_baseline.json"
+# Written with the baseline: sha256 of its bytes and of its canonical (volatile-free) form
+SIDECAR_PATH = BASELINE_PATH.with_suffix(".sha256")
 PROBE = Path("contract_probe.py")
+INSTRUMENT = Path("phi_otimes_o_instrument_v0_1.py")
+
 
+def _read_sidecar() -> Dict[str, str]:
+    """{"<baseline file name>": raw sha256, "canonical": canonical sha256}; {} if absent/unreadable."""
+    try:
+        lines = SIDECAR_PATH.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return {}
+    return {name: digest for digest, _, name in (line.partition("  ") for line in lines) if name}
 
-VOLATILE_TOPLEVEL_KEYS = {
-    "validation_timestamp",
-    "instrument_path",
-    "instrument_hash",
-    "_probe_forensics",
-}
 
+def _write_sidecar(baseline_bytes: bytes, canonical_digest: str) -> None:
+    SIDECAR_PATH.write_text(
+        f"{hashlib.sha256(baseline_bytes).hexdigest()}  {BASELINE_PATH.name}\n{canonical_digest}  canonical\n",
+        encoding="utf-8",
+    )
 
-def _canonicalize(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        return {k: _canonicalize(obj[k]) for k in sorted(obj.keys(), key=lambda x: str(x))}
-    if isinstance(obj, list):
-        return [_canonicalize(x) for x in obj]
-    return obj
 
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity, ints beyond 64 bits: stdlib json decides
+    return json.loads(raw.decode("utf-8"))
 
-def _strip_volatile(b: Dict[str, Any]) -> Dict[str, Any]:
-    return {k: v for k, v in b.items() if k not in VOLATILE_TOPLEVEL_KEYS}
 
+def _dump_baseline(obj: Any) -> bytes:
+    """
+    Indented, key-sorted UTF-8 JSON + trailing newline. Stdlib encoder only: orjson spells
+    some floats differently, and the file (and its sidecar digest) must not depend on it.
+    """
+    return (json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
 
-def _run_probe(tmp_out: Path) -> None:
+
+def _run_probe(probe: Any, argv: List[str]) -> bytes:
+    """
+    Runs the probe's main(argv) in-process (no interpreter startup) and returns its
+    stdout bytes (the baseline with `--out -`). PHIO_SUBPROCESS=1 runs
+    `$PYTHON contract_probe.py ...` instead, as for the instrument CLI tests.
+    A non-zero exit fails the same way in both modes (CalledProcessError).
+    """
     if not PROBE.exists():
         raise RuntimeError(f"Missing {PROBE}")
-    cmd = [os.environ.get("PYTHON", "python"), str(PROBE), "--out", str(tmp_out)]
-    subprocess.run(cmd, check=True)
+    if os.getenv("PHIO_SUBPROCESS", "0").strip() == "1":
+        cmd = [os.environ.get("PYTHON", "python"), str(PROBE), *argv]
+        return subprocess.run(cmd, check=True, stdout=subprocess.PIPE).stdout
+
+    out = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    try:
+        with contextlib.redirect_stdout(out):
+            rc = probe.main(argv)
+    except SystemExit as e:  # argparse errors
+        rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    if rc:
+        raise subprocess.CalledProcessError(rc, [str(PROBE), *argv])
+    out.flush()
+    return out.buffer.getvalue()
+
+
+def _probe_output(probe: Any, stable: bool) -> bytes:
+    """Probe output bytes for INSTRUMENT (`--stable` form if stable), from a fresh run."""
+    argv = ["--instrument", str(INSTRUMENT), "--out", "-"]
+    if stable:
+        argv.append("--stable")
+    return _run_probe(probe, argv)
 
 
 @pytest.mark.contract
-def test_contract_baseline_regression(tmp_path: Path) -> None:
+def test_contract_baseline_regression(request: pytest.FixtureRequest, probe: Any) -> None:
     update = os.environ.get("PHIO_UPDATE_BASELINE", "false").lower() == "true"
-    tmp_out = tmp_path / "contract_baseline.current.json"
-
-    # generate current baseline
-    _run_probe(tmp_out)
-    current = json.loads(tmp_out.read_text(encoding="utf-8"))
-
-    # ensure baseline directory exists
-    BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     if update or not BASELINE_PATH.exists():
-        BASELINE_PATH.write_text(json.dumps(_canonicalize(current), ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-                                 encoding="utf-8")
+        # full document (volatile fields included), generated on the probe's stdout
+        current = _loads(_probe_output(probe, stable=False))
+        data = _dump_baseline(current)
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_bytes(data)
+        _write_sidecar(data, hashlib.sha256(probe.stable_json_bytes(current)).hexdigest())
         # If we're updating, this is considered success.
         return
 
-    baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
-    c = _canonicalize(_strip_volatile(current))
-    b = _canonicalize(_strip_volatile(baseline))
+    # `--stable` output is already the canonical form (volatile fields dropped, keys
+    # sorted, compact): hashed as is, parsed only on a mismatch.
+    current_canon = _probe_output(probe, stable=True)
+    current_digest = hashlib.sha256(current_canon).hexdigest()
+
+    # Fast paths without parsing the baseline, both keyed by sha256(raw baseline bytes) so
+    # a hand-edited baseline is never vouched for by a stale digest:
+    # - the sidecar written with the baseline (shared through the repo / CI),
+    # - else the pytest cache, filled by a previous green run.
+    baseline_raw = BASELINE_PATH.read_bytes()
+    raw_digest = hashlib.sha256(baseline_raw).hexdigest()
+    sidecar = _read_sidecar()
+    if sidecar.get(BASELINE_PATH.name) == raw_digest and sidecar.get("canonical") == current_digest:
+        return
+    cache = getattr(request.config, "cache", None)  # None with -p no:cacheprovider
+    cache_key = f"phio/baseline/{raw_digest}"
+    if cache is not None and cache.get(cache_key, None) == current_digest:
+        return
+
+    baseline = _loads(baseline_raw)
+    # one byte compare of the canonical serializations
+    if probe.stable_json_bytes(baseline) == current_canon:
+        if cache is not None:
+            cache.set(cache_key, current_digest)
+        return
 
+    # mismatch: dict comparison decides (key order, number spelling never mattered) and
+    # gives pytest's diff
+    # timestamps, paths, forensics: the probe's own definition of a run-specific field
+    b = probe.strip_volatile(baseline)
+    c = probe.strip_volatile(_loads(current_canon))
     assert b == c, (
         "Contract baseline drift detected.\n"
         "If the change is intentional, run with PHIO_UPDATE_BASELINE=true to update baseline."